@@ -44,8 +44,10 @@ if (!fs.existsSync(LOG_DIR)) {
     fs.mkdirSync(LOG_DIR, { recursive: true });
 }
 
-// Python script path
-const SPEECH_SCRIPT = path.join(__dirname, 'speechRecognition.py');
+// Python script path (the thin client forwards to a running speech_server.py worker)
+const SPEECH_SCRIPT = process.env.SPEECH_SOCKET_PATH
+    ? path.join(__dirname, 'speech_client.py')
+    : path.join(__dirname, 'speechRecognition.py');
 
 // Supported audio formats
 const SUPPORTED_FORMATS = ['WAV', 'MP3', 'FLAC', 'AIFF', 'OGG', 'M4A', 'RAW', 'PCM'];
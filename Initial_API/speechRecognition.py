@@ -19,18 +19,69 @@ import sys
 import io
 import json
 import wave
+import struct
 import numpy as np
-from scipy import signal
-import audioop
+import math
 import os
 import time
-from typing import Optional, Dict, List, Any, Tuple
+import hashlib
+import threading
+import http.client
+import socket
+import urllib.error
+import urllib.request
+import urllib.response
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from functools import lru_cache
+from typing import Optional, Dict, List, Any, Tuple, NamedTuple
+
+# Optional faster JSON serializer and parser, falls back to the standard library
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    json_loads = json.loads
+
+# scipy.signal is imported on first use; requests rejected during validation
+# or run with --skip-preprocessing never pay for it
+signal = None
 
 # Vosk imports
 vosk = None
+VOSK_AVAILABLE: Optional[bool] = None  # None until the first import attempt
 VOSK_MODEL = None  # Store loaded model globally
+VOSK_MODEL_LOCK = threading.Lock()
+# Idle KaldiRecognizers keyed by (sample rate, command mode). A recognizer is
+# checked out for the length of one decode, so a timed-out request's Vosk
+# thread never shares one with the next request in a long-lived process.
+KALDI_POOL: Dict[Tuple[int, bool], List[Any]] = {}
+KALDI_POOL_LOCK = threading.Lock()
+KALDI_POOL_SIZE = 2  # Idle recognizers kept per key
 vosk_model_path = os.environ.get('VOSK_MODEL_PATH', 'model/vosk-model-small-en-us-0.15') # Path to Vosk model
 
+# Successful transcriptions keyed by (audio digest, sample rate, service, command mode)
+TRANSCRIPT_CACHE: "OrderedDict[Tuple[bytes, int, str, bool], ServiceResult]" = OrderedDict()
+TRANSCRIPT_CACHE_SIZE = 1024
+TRANSCRIPT_CACHE_LOCK = threading.Lock()
+
+# A lower-preference success is held back at most this long for a preferred service
+PREFERRED_SERVICE_GRACE = 0.5  # seconds
+
+# Shared by every request so a long-lived process reuses its service threads.
+# Sized for two services plus two left running by a timed-out request.
+RECOGNITION_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="recognition")
+
+# Shared recognizer, configured for AAC context (optimized for quick responses)
+RECOGNIZER = sr.Recognizer()
+RECOGNIZER.energy_threshold = 300
+RECOGNIZER.dynamic_energy_threshold = True
+RECOGNIZER.pause_threshold = 0.4  # Shorter for faster response
+RECOGNIZER.phrase_threshold = 0.2
+RECOGNIZER.non_speaking_duration = 0.2
+RECOGNIZER.operation_timeout = 10  # Reduced timeout for AAC responsiveness
+
 # =============================================================================
 # AAC Command Configuration
 # =============================================================================
@@ -40,14 +91,18 @@ AAC_COMMANDS = [
     # Navigation
     "yes", "no", "help", "back", "next", "previous", "home", "menu", "exit", "stop",
     # Selection
-    "select", "choose", "pick", "open", "close", "cancel", "confirm", "delete", "this"
+    "select", "choose", "pick", "open", "close", "cancel", "confirm", "delete", "this",
     # Communication
     "hello", "goodbye", "thank you", "please", "sorry", "wait", "more", "done",
     # Actions
-    "play", "pause", "repeat", "louder", "quieter", "up", "down", "left", "right", "top"
+    "play", "pause", "repeat", "louder", "quieter", "up", "down", "left", "right", "top",
     # Game Actions
     "center", "middle right", "middle left", "bottom right", "bottom center", "bottom left", "top left", "top center", "top right"
 ]
+AAC_COMMANDS_SET = frozenset(AAC_COMMANDS)
+
+# Vosk grammar for command mode, serialized once at import
+AAC_GRAMMAR_JSON = json.dumps(sorted(AAC_COMMANDS_SET))
 
 # Command categories for response classification
 COMMAND_CATEGORIES = {
@@ -57,6 +112,24 @@ COMMAND_CATEGORIES = {
     "media": ["play", "pause", "stop", "repeat", "louder", "quieter"]
 }
 
+# Reverse lookup built once at import: command -> category
+COMMAND_TO_CATEGORY = {
+    command: category
+    for category, commands in COMMAND_CATEGORIES.items()
+    for command in commands
+}
+
+# Category precedence when one utterance contains commands from several
+CATEGORY_PRIORITY = {category: index for index, category in enumerate(COMMAND_CATEGORIES)}
+
+# Follow-up actions offered to the client for each command category
+SUGGESTED_ACTIONS = {
+    "navigation": ("confirm_navigation", "show_menu", "go_back"),
+    "selection": ("confirm_selection", "cancel", "show_options"),
+    "communication": ("send_message", "repeat", "edit"),
+    "media": ("adjust_volume", "skip", "stop")
+}
+
 # Supported audio formats with optimal settings
 SUPPORTED_FORMATS = {
     "WAV": {"extensions": [".wav"], "optimal_sample_rate": 16000, "optimal_bit_depth": 16},
@@ -81,34 +154,90 @@ def load_vosk_model(model_path: str) -> Optional[Any]:
     Returns:
         Loaded Vosk model or None if loading fails
     """
-    global vosk, VOSK_MODEL
+    global vosk, VOSK_AVAILABLE, VOSK_MODEL
 
     # Return cached model if already loaded
     if VOSK_MODEL is not None:
         return VOSK_MODEL
+    # A missing package will not appear mid-process; don't rescan sys.path
+    if VOSK_AVAILABLE is False:
+        return None
 
-    try:
-        import vosk as vosk_module
-        vosk = vosk_module
-        vosk.SetLogLevel(-1)  # Reduce Vosk logging noise
+    # Serialize loading so a background preload and a request never load twice
+    with VOSK_MODEL_LOCK:
+        if VOSK_MODEL is not None:
+            return VOSK_MODEL
+
+        try:
+            import vosk as vosk_module
+            vosk = vosk_module
+            VOSK_AVAILABLE = True
+            vosk.SetLogLevel(-1)  # Reduce Vosk logging noise
         
-        if not os.path.exists(model_path):
-            log_debug(f"Vosk model not found at {model_path}")
-            return None
+            if not os.path.exists(model_path):
+                log_debug(f"Vosk model not found at {model_path}")
+                return None
         
-        log_debug(f"Loading Vosk model from {model_path}...")
-        start_time = time.time()
-        VOSK_MODEL = vosk.Model(model_path)
-        load_time = (time.time() - start_time) * 1000
-        log_debug(f"Vosk model loaded in {load_time:.0f}ms")
-        return VOSK_MODEL
+            log_debug(f"Loading Vosk model from {model_path}...")
+            start_time = time.monotonic_ns()
+            VOSK_MODEL = vosk.Model(model_path)
+            log_debug(f"Vosk model loaded in {elapsed_ms(start_time)}ms")
+            return VOSK_MODEL
         
-    except ImportError:
-        log_debug("Vosk module not found. Install: pip install vosk")
-        return None
-    except Exception as e:
-        log_debug(f"Failed to load Vosk model: {e}")
-        return None
+        except ImportError:
+            VOSK_AVAILABLE = False
+            log_debug("Vosk module not found. Install: pip install vosk")
+            return None
+        except Exception as e:
+            log_debug(f"Failed to load Vosk model: {e}")
+            return None
+
+
+def acquire_kaldi_recognizer(model: Any, sample_rate: int, command_mode: bool = False) -> Any:
+    """
+    Check out a KaldiRecognizer for the given sample rate and mode.
+    
+    Idle recognizers are pooled per (sample rate, command mode) so repeated
+    requests reuse a decoder instead of constructing a new one. In command
+    mode the recognizer is restricted to the AAC command grammar, which is
+    much cheaper to decode against than the full language model. Hand the
+    recognizer back with release_kaldi_recognizer when done.
+    
+    Args:
+        model: Loaded Vosk model
+        sample_rate: Audio sample rate in Hz
+        command_mode: If True, restrict to the AAC command grammar
+        
+    Returns:
+        Ready-to-use KaldiRecognizer owned by the caller
+    """
+    with KALDI_POOL_LOCK:
+        idle = KALDI_POOL.get((sample_rate, command_mode))
+        if idle:
+            return idle.pop()
+    
+    if command_mode:
+        rec = vosk.KaldiRecognizer(model, sample_rate, AAC_GRAMMAR_JSON)
+    else:
+        rec = vosk.KaldiRecognizer(model, sample_rate)
+    rec.SetWords(True)
+    return rec
+
+
+def release_kaldi_recognizer(rec: Any, sample_rate: int, command_mode: bool = False) -> None:
+    """
+    Reset a recognizer and return it to the idle pool.
+    
+    Args:
+        rec: Recognizer from acquire_kaldi_recognizer
+        sample_rate: Sample rate it was acquired for
+        command_mode: Mode it was acquired for
+    """
+    rec.Reset()
+    with KALDI_POOL_LOCK:
+        idle = KALDI_POOL.setdefault((sample_rate, command_mode), [])
+        if len(idle) < KALDI_POOL_SIZE:
+            idle.append(rec)
 
 
 def get_model_status() -> Dict[str, Any]:
@@ -128,23 +257,35 @@ def warm_up_models() -> Dict[str, bool]:
     Returns:
         Dictionary with warm-up status for each model
     """
-    results = {"vosk": False}
+    results = {"vosk": False, "preprocessing": False}
+    start_time = time.monotonic_ns()
     
     # Warm up Vosk
     model = load_vosk_model(vosk_model_path)
     if model is not None:
         try:
-            # Create a short silent audio to initialize recognizer
-            sample_rate = 16000
-            silent_audio = bytes(sample_rate * 2)  # 1 second of silence (16-bit)
-            rec = vosk.KaldiRecognizer(model, sample_rate)
-            rec.AcceptWaveform(silent_audio)
-            rec.FinalResult()
+            # Build and prime the free-form and command-grammar recognizers
+            # at the rate every request is resampled to
+            sample_rate = TARGET_SAMPLE_RATE
+            silent_audio = bytes(sample_rate // 5)  # 100ms of silence (16-bit)
+            for command_mode in (False, True):
+                rec = acquire_kaldi_recognizer(model, sample_rate, command_mode)
+                rec.AcceptWaveform(silent_audio)
+                rec.FinalResult()
+                release_kaldi_recognizer(rec, sample_rate, command_mode)
             results["vosk"] = True
             log_debug("Vosk model warmed up successfully")
         except Exception as e:
             log_debug(f"Vosk warm-up failed: {e}")
     
+    # Import scipy.signal and design the high-pass filter for the native rate
+    try:
+        results["preprocessing"] = get_highpass_sos(TARGET_SAMPLE_RATE) is not None
+    except Exception as e:
+        results["preprocessing"] = False
+        log_debug(f"Preprocessing warm-up failed: {e}")
+    
+    log_debug(f"Warm-up finished in {elapsed_ms(start_time)}ms: {results}")
     return results
 
 
@@ -152,9 +293,40 @@ def warm_up_models() -> Dict[str, bool]:
 # Logging Utilities
 # =============================================================================
 
-def log_debug(message: str) -> None:
-    """Print debug message to stderr."""
-    print(message, file=sys.stderr)
+# Debug logging is opt-in so the request path makes no stderr writes by default
+DEBUG = os.environ.get('SPEECH_DEBUG', 'false').lower() == 'true'
+
+if DEBUG:
+    def log_debug(message: str) -> None:
+        """Print debug message to stderr."""
+        print(message, file=sys.stderr)
+else:
+    def log_debug(message: str) -> None:
+        """Discard debug message (set SPEECH_DEBUG=true to enable)."""
+
+
+def elapsed_ms(start_ns: int) -> int:
+    """Milliseconds elapsed since a time.monotonic_ns() reading."""
+    return (time.monotonic_ns() - start_ns) // 1_000_000
+
+
+class StageTimer:
+    """Per-stage latency breakdown of one request, logged in debug mode."""
+
+    def __init__(self) -> None:
+        self.last_ns = time.monotonic_ns()
+        self.stages: Dict[str, float] = {}
+
+    def mark(self, stage: str) -> None:
+        """Record the time since the previous mark under stage."""
+        now = time.monotonic_ns()
+        self.stages[stage] = round((now - self.last_ns) / 1_000_000, 2)
+        self.last_ns = now
+
+    def log(self) -> None:
+        """Log the recorded stages (ms) as one JSON line."""
+        if DEBUG:
+            log_debug(f"Stage timings (ms): {json.dumps(self.stages)}")
 
 
 # =============================================================================
@@ -174,32 +346,99 @@ def detect_audio_format(audio_bytes: bytes) -> str:
     if len(audio_bytes) < 12:
         return 'UNKNOWN'
     
-    if audio_bytes.startswith(b'RIFF') and audio_bytes[8:12] == b'WAVE':
+    # startswith() compares in place instead of allocating a slice per check
+    if audio_bytes.startswith(b'RIFF') and audio_bytes.startswith(b'WAVE', 8):
         return 'WAV'
-    elif audio_bytes[0:3] == b'ID3' or audio_bytes[0:2] == b'\xff\xfb':
+    elif audio_bytes.startswith((b'ID3', b'\xff\xfb')):
         return 'MP3'
-    elif audio_bytes[0:4] == b'fLaC':
+    elif audio_bytes.startswith(b'fLaC'):
         return 'FLAC'
-    elif audio_bytes[0:4] == b'OggS':
+    elif audio_bytes.startswith(b'OggS'):
         return 'OGG'
     else:
         return 'UNKNOWN'
 
 
-def get_wav_metadata(audio_file: io.BytesIO) -> Dict[str, Any]:
+def find_riff_chunks(audio_bytes: bytes) -> Dict[bytes, Tuple[int, int]]:
+    """
+    Locate the fmt and data chunks of a WAV file in one pass.
+    
+    Args:
+        audio_bytes: Raw WAV bytes
+        
+    Returns:
+        Mapping of chunk id to (payload offset, payload size), stopping at
+        the data chunk
+    """
+    chunks = {}
+    offset = 12
+    while offset + 8 <= len(audio_bytes):
+        chunk_id, chunk_size = struct.unpack_from('<4sI', audio_bytes, offset)
+        offset += 8
+        chunks[chunk_id] = (offset, chunk_size)
+        if chunk_id == b'data':
+            break
+        offset += chunk_size + (chunk_size & 1)  # Chunks are word-aligned
+    return chunks
+
+
+# WAV fmt codes; extensible headers carry the real code in their SubFormat GUID
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+def is_pcm_format(audio_bytes: bytes, fmt: Tuple[int, int]) -> bool:
+    """
+    Check whether a WAV fmt chunk describes integer PCM.
+    
+    Args:
+        audio_bytes: Raw WAV bytes
+        fmt: (payload offset, payload size) of the fmt chunk
+        
+    Returns:
+        True for plain PCM and for WAVE_FORMAT_EXTENSIBLE wrapping PCM
+    """
+    offset, size = fmt
+    audio_encoding = struct.unpack_from('<H', audio_bytes, offset)[0]
+    if audio_encoding == WAVE_FORMAT_EXTENSIBLE and size >= 26:
+        audio_encoding = struct.unpack_from('<H', audio_bytes, offset + 24)[0]
+    return audio_encoding == WAVE_FORMAT_PCM
+
+
+def get_wav_metadata(audio_bytes: bytes) -> Dict[str, Any]:
     """
     Extract metadata from WAV audio file.
     
+    PCM headers (including extensible ones) are unpacked directly;
+    anything else goes through the wave module.
+    
     Args:
-        audio_file: BytesIO object containing WAV data
+        audio_bytes: Raw WAV bytes
         
     Returns:
         Dictionary with audio metadata
     """
+    chunks = find_riff_chunks(audio_bytes)
+    fmt = chunks.get(b'fmt ')
+    data = chunks.get(b'data')
+    if fmt is not None and data is not None and fmt[1] >= 16:
+        channels, sample_rate, _, _, bits = struct.unpack_from('<HIIHH', audio_bytes, fmt[0] + 2)
+        sample_width = (bits + 7) // 8
+        if is_pcm_format(audio_bytes, fmt) and channels > 0 and sample_width > 0:
+            frames = data[1] // (channels * sample_width)  # As declared, like wave
+            duration = frames / float(sample_rate) if sample_rate > 0 else 0
+            return {
+                'duration': round(duration, 3),
+                'sampleRate': sample_rate,
+                'sampleWidth': sample_width,
+                'channels': channels,
+                'format': 'WAV',
+                'frames': frames
+            }
+
     metadata = {}
     try:
-        audio_file.seek(0)
-        with wave.open(audio_file, 'rb') as wf:
+        with wave.open(io.BytesIO(audio_bytes), 'rb') as wf:
             sample_rate = wf.getframerate()
             sample_width = wf.getsampwidth()
             channels = wf.getnchannels()
@@ -218,16 +457,175 @@ def get_wav_metadata(audio_file: io.BytesIO) -> Dict[str, Any]:
     return metadata
 
 
-def preprocess_audio(recognizer: sr.Recognizer, audio: sr.AudioData) -> sr.AudioData:
+def extract_wav_pcm(audio_bytes: bytes, metadata: Dict[str, Any]) -> Optional[bytes]:
+    """
+    Get mono 16-bit PCM from an uncompressed WAV without a second decode pass.
+    
+    This is the path straight to the recognizers: no sr.AudioFile, no
+    soundfile, at most one NumPy conversion.
+    
+    Mono 16-bit data is sliced out as-is; 8/24/32-bit and multi-channel
+    data is converted with NumPy in one step.
+    
+    Args:
+        audio_bytes: Raw WAV bytes
+        metadata: Metadata from get_wav_metadata
+        
+    Returns:
+        Mono 16-bit PCM bytes, or None if the WAV needs full decoding
+    """
+    channels = metadata.get('channels')
+    sample_width = metadata.get('sampleWidth')
+    if not channels or sample_width not in (1, 2, 3, 4):
+        return None
+    
+    chunks = find_riff_chunks(audio_bytes)
+    fmt = chunks.get(b'fmt ')
+    data = chunks.get(b'data')
+    if fmt is None or data is None:
+        return None
+    if not is_pcm_format(audio_bytes, fmt):  # Only uncompressed PCM
+        return None
+    start = data[0]
+    size = min(data[1], len(audio_bytes) - start)
+    # Drop any trailing partial frame (truncated file or odd-length chunk)
+    frame_size = channels * sample_width
+    size -= size % frame_size
+    if channels == 1 and sample_width == 2:
+        return audio_bytes[start:start + size]
+    
+    # Read samples in place (no slice copy), then convert to mono int16
+    count = size // sample_width
+    if sample_width == 1:
+        samples = (np.frombuffer(audio_bytes, np.uint8, count=count, offset=start).astype(np.int16) - 128) << 8
+    elif sample_width == 2:
+        samples = np.frombuffer(audio_bytes, '<i2', count=count, offset=start)
+    elif sample_width == 3:
+        # Keep the top two bytes of each little-endian 24-bit sample
+        packed = np.frombuffer(audio_bytes, np.uint8, count=count * 3, offset=start).reshape(-1, 3)
+        samples = np.ascontiguousarray(packed[:, 1:]).view('<i2').ravel()
+    else:
+        samples = (np.frombuffer(audio_bytes, '<i4', count=count, offset=start) >> 16).astype(np.int16)
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1).astype(np.int16)
+    return samples.astype('<i2', copy=False).tobytes()  # WAV order on any host
+
+
+# Largest declared WAV size we trust enough to allocate up front
+MAX_PREALLOCATED_AUDIO_BYTES = 64 * 1024 * 1024
+AUDIO_READ_CHUNK = 1 << 20  # 1 MiB per read syscall
+
+# Native sample rate of the bundled Vosk model
+TARGET_SAMPLE_RATE = 16000
+
+# Preprocessing gates: skip work the audio does not need
+LOW_BAND_CUTOFF_HZ = 80
+LOW_BAND_MAX_FRACTION = 0.02  # Below this, the high-pass filter changes little
+NORMALIZED_PEAK_RANGE = (20000, 32000)  # Peaks here are already well-scaled
+
+
+def load_scipy_signal() -> Any:
+    """
+    Import scipy.signal on first use.
+    
+    Returns:
+        The scipy.signal module
+    """
+    global signal
+    if signal is None:
+        from scipy import signal as scipy_signal
+        signal = scipy_signal
+    return signal
+
+
+@lru_cache(maxsize=8)
+def get_highpass_sos(sample_rate: int) -> Optional[np.ndarray]:
+    """
+    Design the AAC high-pass Butterworth filter for a sample rate.
+    
+    Args:
+        sample_rate: Audio sample rate in Hz
+        
+    Returns:
+        Second-order sections (float32), or None if the cutoff is invalid
+    """
+    nyquist = sample_rate / 2
+    normal_cutoff = LOW_BAND_CUTOFF_HZ / nyquist  # Remove frequencies below 80Hz (common noise floor)
+    
+    # Check if cutoff is valid
+    if normal_cutoff >= 1.0 or normal_cutoff <= 0:
+        return None
+    
+    sos = load_scipy_signal().butter(4, normal_cutoff, btype='high', analog=False, output='sos')
+    return sos.astype(np.float32)
+
+
+@lru_cache(maxsize=8)
+def get_lowband_sos(sample_rate: float) -> np.ndarray:
+    """
+    Design the low-pass filter that isolates the band the high-pass removes.
+    
+    Args:
+        sample_rate: Sample rate of the decimated signal in Hz
+        
+    Returns:
+        Second-order sections (float32)
+    """
+    sos = load_scipy_signal().butter(4, LOW_BAND_CUTOFF_HZ / (sample_rate / 2), btype='low', output='sos')
+    return sos.astype(np.float32)
+
+
+def low_band_energy_fraction(samples: np.ndarray, sample_rate: int) -> float:
+    """
+    Estimate the fraction of signal energy below the high-pass cutoff.
+    
+    Block means decimate the signal to about 8x the cutoff (their nulls
+    fall on the frequencies that would alias into the low band), and a
+    low-pass on the short decimated signal isolates the band. This costs
+    a fraction of the high-pass it gates; a Welch PSD cost more than the
+    filter itself. DC offset counts as low band, since the filter removes it.
+    
+    Args:
+        samples: Audio samples
+        sample_rate: Audio sample rate in Hz
+        
+    Returns:
+        Fraction of total power below LOW_BAND_CUTOFF_HZ (0-1)
+    """
+    block = max(1, sample_rate // (8 * LOW_BAND_CUTOFF_HZ))
+    count = len(samples) // block
+    data = samples[:count * block].astype(np.float32)
+    total = float(np.dot(data, data))
+    if total <= 0:
+        return 0.0
+    
+    low = load_scipy_signal().sosfilt(
+        get_lowband_sos(sample_rate / block),
+        data.reshape(count, block).mean(axis=1)
+    )
+    return float(np.dot(low, low)) * block / total
+
+
+def preprocess_audio(
+    recognizer: sr.Recognizer,
+    audio: sr.AudioData,
+    peak: Optional[int] = None,
+    use_simple_filter: bool = False
+) -> sr.AudioData:
     """
     Preprocess audio data for better recognition in AAC context.
     
     Applies high-pass filter to remove low-frequency noise common in
-    AAC device environments (HVAC, motor noise, etc.)
+    AAC device environments (HVAC, motor noise, etc.) and normalizes
+    the level. Either step is skipped when the audio is already clean
+    or already well-scaled.
     
     Args:
         recognizer: SpeechRecognition Recognizer instance
         audio: AudioData to preprocess
+        peak: Precomputed absolute peak of the input, if known
+        use_simple_filter: If True, use a single-pass one-pole high-pass
+            instead of the 4th-order Butterworth filter
         
     Returns:
         Preprocessed AudioData
@@ -239,31 +637,50 @@ def preprocess_audio(recognizer: sr.Recognizer, audio: sr.AudioData) -> sr.Audio
         if len(raw_data) == 0:
             return audio
         
-        # Apply high-pass filter to remove low frequency noise
-        nyquist = audio.sample_rate / 2
-        low_cutoff = 80  # Remove frequencies below 80Hz (common noise floor)
-        normal_cutoff = low_cutoff / nyquist
+        if peak is None:
+            peak = max(-int(raw_data.min()), int(raw_data.max()))
+        needs_normalize = not (NORMALIZED_PEAK_RANGE[0] <= peak <= NORMALIZED_PEAK_RANGE[1])
+        needs_filter = low_band_energy_fraction(raw_data, audio.sample_rate) >= LOW_BAND_MAX_FRACTION
         
-        # Check if cutoff is valid
-        if normal_cutoff >= 1.0 or normal_cutoff <= 0:
-            log_debug("Warning: Invalid cutoff frequency, skipping filter")
+        if not needs_filter and not needs_normalize:
+            log_debug("Audio already clean, skipping preprocessing")
             return audio
         
-        # Design and apply Butterworth high-pass filter
-        b, a = signal.butter(4, normal_cutoff, btype='high', analog=False)
-        filtered_data = signal.filtfilt(b, a, raw_data)
-
-        # Normalize audio to prevent clipping
-        max_val = np.max(np.abs(filtered_data))
-        if max_val > 0:
-            filtered_data = filtered_data * (32767 * 0.9 / max_val)
-
-        # Ensure data is in valid range
-        filtered_data = np.clip(filtered_data, -32768, 32767)
+        filtered_data = raw_data.astype(np.float32)
+        
+        if needs_filter and use_simple_filter:
+            # One-pole high-pass: y[n] = alpha * (y[n-1] + x[n] - x[n-1])
+            # (float32 coefficients keep lfilter from upcasting to float64)
+            rc = 1.0 / (2 * math.pi * LOW_BAND_CUTOFF_HZ)
+            alpha = rc / (rc + 1.0 / audio.sample_rate)
+            filtered_data = load_scipy_signal().lfilter(
+                np.array([alpha, -alpha], dtype=np.float32),
+                np.array([1.0, -alpha], dtype=np.float32),
+                filtered_data
+            )
+            peak = max(-filtered_data.min(), filtered_data.max())
+        elif needs_filter:
+            sos = get_highpass_sos(audio.sample_rate)
+            if sos is None:
+                log_debug("Warning: Invalid cutoff frequency, skipping filter")
+                return audio
+            
+            # Apply Butterworth high-pass filter (SOS form is stable at order 4).
+            # A single causal pass is enough: recognizers ignore phase.
+            filtered_data = load_scipy_signal().sosfilt(sos, filtered_data).astype(np.float32, copy=False)
+            peak = max(-filtered_data.min(), filtered_data.max())
+
+        # Normalize audio to 90% of full scale, writing int16 directly so
+        # scaling and conversion share one pass. peak is the exact maximum
+        # magnitude of filtered_data, so the result is already within int16
+        # range and needs no separate clipping pass.
+        scale = 32767 * 0.9 / peak if peak > 0 else 1.0
+        processed = np.empty(filtered_data.shape, dtype=np.int16)
+        np.multiply(filtered_data, np.float32(scale), out=processed, casting='unsafe')
 
         # Create new AudioData with processed audio
         processed_audio = sr.AudioData(
-            filtered_data.astype(np.int16).tobytes(),
+            processed.tobytes(),
             audio.sample_rate,
             audio.sample_width
         )
@@ -274,24 +691,125 @@ def preprocess_audio(recognizer: sr.Recognizer, audio: sr.AudioData) -> sr.Audio
         return audio
 
 
-def adjust_ambient_noise(recognizer: sr.Recognizer, source: sr.AudioSource, duration: float = 0.3) -> None:
+def resample_audio(audio: sr.AudioData, target_rate: int = TARGET_SAMPLE_RATE) -> sr.AudioData:
     """
-    Adjust for ambient noise in the audio source.
-    Uses shorter duration for faster AAC response times.
+    Downsample audio once to the recognizers' native rate.
+    
+    Both backends accept 16kHz natively, so converting high-rate input
+    up front shrinks the buffer every later stage has to touch.
     
     Args:
-        recognizer: SpeechRecognition Recognizer instance
-        source: Audio source to calibrate
-        duration: Calibration duration in seconds (default 0.3 for AAC speed)
+        audio: AudioData to resample
+        target_rate: Desired sample rate in Hz
+        
+    Returns:
+        Resampled AudioData, or the original if no conversion is needed
     """
+    if audio.sample_rate <= target_rate or audio.sample_width != 2:
+        return audio
+    
     try:
-        recognizer.adjust_for_ambient_noise(source, duration=min(duration, 0.5))
-    except Exception:
-        # If calibration fails, use optimized default for AAC devices
-        recognizer.energy_threshold = 350
+        raw_data = np.frombuffer(audio.frame_data, np.int16)
+        divisor = math.gcd(target_rate, audio.sample_rate)
+        resampled = load_scipy_signal().resample_poly(
+            raw_data.astype(np.float32),
+            target_rate // divisor,
+            audio.sample_rate // divisor
+        )
+        np.clip(resampled, -32768, 32767, out=resampled)
+        log_debug(f"Resampled audio from {audio.sample_rate}Hz to {target_rate}Hz")
+        return sr.AudioData(resampled.astype(np.int16).tobytes(), target_rate, 2)
+    except Exception as e:
+        log_debug(f"Resampling failed: {e}, using original audio")
+        return audio
+
 
+# Energy VAD: 20ms frames at 16kHz, keeping some context around speech
+VAD_FRAME_SAMPLES = 320
+VAD_MIN_RMS = 50  # Never above validate_audio_quality's silence floor
+VAD_RELATIVE_RMS = 0.05  # ...nor those far below the loudest frame
+VAD_PADDING_FRAMES = 10  # 200ms kept either side of detected speech
 
-def validate_audio_quality(audio: sr.AudioData, sample_rate: int, duration: float) -> Dict[str, Any]:
+
+def trim_silence(audio: sr.AudioData) -> sr.AudioData:
+    """
+    Trim leading and trailing silence with a frame-energy VAD.
+    
+    Press-to-talk AAC clips are often padded with silence that every
+    later stage, and the recognizers in particular, would otherwise
+    process.
+    
+    Args:
+        audio: 16-bit AudioData to trim
+        
+    Returns:
+        Trimmed AudioData, or the original if nothing is trimmed, no
+        frame stands out as speech, or the width is unsupported
+    """
+    if audio.sample_width != 2:
+        return audio
+    
+    samples = np.frombuffer(audio.frame_data, np.int16)
+    frame_count = len(samples) // VAD_FRAME_SAMPLES
+    if frame_count == 0:
+        return audio
+    
+    frames = samples[:frame_count * VAD_FRAME_SAMPLES].reshape(frame_count, VAD_FRAME_SAMPLES).astype(np.float32)
+    frame_rms = np.sqrt(np.einsum('ij,ij->i', frames, frames) / VAD_FRAME_SAMPLES)
+    threshold = max(VAD_MIN_RMS, VAD_RELATIVE_RMS * float(frame_rms.max()))
+    voiced = np.flatnonzero(frame_rms > threshold)
+    if len(voiced) == 0:
+        # Validation already accepted the clip; let the recognizer decide
+        return audio
+    
+    first = max(0, int(voiced[0]) - VAD_PADDING_FRAMES) * VAD_FRAME_SAMPLES
+    last = min(frame_count, int(voiced[-1]) + 1 + VAD_PADDING_FRAMES) * VAD_FRAME_SAMPLES
+    if last >= frame_count * VAD_FRAME_SAMPLES:
+        last = len(samples)  # Keep the partial frame at the end
+    if first == 0 and last == len(samples):
+        return audio
+    
+    log_debug(f"VAD trimmed audio to samples {first}-{last} of {len(samples)}")
+    return sr.AudioData(audio.frame_data[first * 2:last * 2], audio.sample_rate, 2)
+
+
+# NumPy sample types for the PCM widths we can analyze directly (little-endian)
+PCM_DTYPES = {1: np.dtype(np.int8), 2: np.dtype('<i2'), 4: np.dtype('<i4')}
+
+
+def audio_stats(pcm_bytes: bytes, sample_width: int) -> Optional[Tuple[float, int]]:
+    """
+    Compute RMS level and absolute peak of PCM audio in one pass.
+    
+    Args:
+        pcm_bytes: Raw little-endian PCM samples
+        sample_width: Bytes per sample
+        
+    Returns:
+        Tuple of (rms, peak), or None if the sample width is unsupported
+    """
+    dtype = PCM_DTYPES.get(sample_width)
+    if dtype is None:
+        return None
+    
+    samples = np.frombuffer(pcm_bytes, dtype=dtype)
+    if samples.size == 0:
+        return 0.0, 0
+    
+    # float32 cannot overflow on squared int16/int32 samples and is ample
+    # precision for level thresholds, at half the temporary of float64
+    as_float = samples.astype(np.float32)
+    rms = math.sqrt(float(np.dot(as_float, as_float)) / samples.size)
+    peak = max(-int(samples.min()), int(samples.max()))
+    return rms, peak
+
+
+def validate_audio_quality(
+    audio: sr.AudioData,
+    sample_rate: int,
+    duration: float,
+    stats: Optional[Tuple[float, int]] = None
+) -> Dict[str, Any]:
     """
     Validate audio quality for AAC context.
     
@@ -299,6 +817,7 @@ def validate_audio_quality(audio: sr.AudioData, sample_rate: int, duration: floa
         audio: AudioData to validate
         sample_rate: Audio sample rate
         duration: Audio duration in seconds
+        stats: Precomputed (rms, peak) from audio_stats, computed if omitted
         
     Returns:
         Dictionary with validation results
@@ -315,14 +834,17 @@ def validate_audio_quality(audio: sr.AudioData, sample_rate: int, duration: floa
         warnings.append("Long audio may increase processing time")
     
     # Check if audio has content (not silent)
-    try:
-        rms = audioop.rms(audio.frame_data, audio.sample_width)
+    if stats is None:
+        stats = audio_stats(audio.frame_data, audio.sample_width)
+    
+    if stats is None:
+        warnings.append("Could not analyze audio volume")
+    else:
+        rms = stats[0]
         if rms < 50:
             issues.append("Audio appears silent or nearly silent")
         elif rms < 200:
             warnings.append("Audio volume is low")
-    except Exception:
-        warnings.append("Could not analyze audio volume")
     
     # Check sample rate
     if sample_rate < 8000:
@@ -341,7 +863,11 @@ def validate_audio_quality(audio: sr.AudioData, sample_rate: int, duration: floa
 # Speech Recognition
 # =============================================================================
 
-def recognize_vosk(audio_data: sr.AudioData, model: Any, command_mode: bool = False) -> Tuple[str, float, Dict]:
+def recognize_vosk(
+    audio_data: sr.AudioData,
+    model: Any,
+    command_mode: bool = False
+) -> Tuple[str, float, List[Dict[str, Any]]]:
     """
     Recognize speech using Vosk offline model.
     
@@ -351,52 +877,53 @@ def recognize_vosk(audio_data: sr.AudioData, model: Any, command_mode: bool = Fa
         command_mode: If True, use limited AAC command vocabulary
         
     Returns:
-        Tuple of (transcription, confidence, full_result)
+        Tuple of (transcription, confidence, word_timing)
     """
     if vosk is None or model is None:
         raise RuntimeError("Vosk model is not loaded")
 
-    rec = vosk.KaldiRecognizer(model, audio_data.sample_rate)
-    rec.SetMaxAlternatives(3)
-    rec.SetWords(True)
+    rec = None
+    use_grammar = False
     
     # Apply command grammar if in command mode
     if command_mode:
-        grammar = json.dumps(AAC_COMMANDS)
         try:
-            rec = vosk.KaldiRecognizer(model, audio_data.sample_rate, grammar)
-            rec.SetWords(True)
+            rec = acquire_kaldi_recognizer(model, audio_data.sample_rate, command_mode=True)
+            use_grammar = True
         except Exception as e:
             log_debug(f"Failed to set command grammar: {e}")
 
-    # Process audio in chunks for better streaming compatibility
-    chunk_size = 4000
-    audio_bytes = audio_data.frame_data
-    
-    for i in range(0, len(audio_bytes), chunk_size):
-        chunk = audio_bytes[i:i+chunk_size]
-        rec.AcceptWaveform(chunk)
+    if rec is None:
+        rec = acquire_kaldi_recognizer(model, audio_data.sample_rate)
 
-    # Finalize recognition
-    result = json.loads(rec.FinalResult())
+    try:
+        # Nothing consumes partial results, so the whole utterance goes to the
+        # decoder in one call; Vosk frames it internally
+        rec.AcceptWaveform(audio_data.frame_data)
+
+        # Finalize recognition
+        final_json = rec.FinalResult()
+    finally:
+        release_kaldi_recognizer(rec, audio_data.sample_rate, use_grammar)
+
+    result = json_loads(final_json)
     text = result.get('text', '').strip()
 
-    # Calculate confidence
-    confidence = 0.5
-    if 'alternatives' in result and result['alternatives']:
-        confidence = result['alternatives'][0].get('confidence', 0.5)
-    elif 'result' in result and result['result']:
-        word_confidences = [word.get('conf', 0.5) for word in result['result']]
-        if word_confidences:
-            confidence = sum(word_confidences) / len(word_confidences)
+    # Calculate confidence from the per-word scores (SetWords)
+    words = result.get('result')
+    confidence = sum(word.get('conf', 0.5) for word in words) / len(words) if words else 0.5
     
-    return text, confidence, result
+    return text, confidence, extract_word_timing(result)
 
 
+@lru_cache(maxsize=256)
 def classify_command(text: str) -> Optional[str]:
     """
     Classify recognized text into AAC command category.
     
+    Results are memoized: AAC users repeat a small set of phrases, and
+    command-mode output is limited to the grammar anyway.
+    
     Args:
         text: Recognized text
         
@@ -407,14 +934,18 @@ def classify_command(text: str) -> Optional[str]:
         return None
     
     text_lower = text.lower().strip()
-    words = text_lower.split()
     
-    for category, commands in COMMAND_CATEGORIES.items():
-        for word in words:
-            if word in commands:
-                return category
+    # Whole-utterance match also covers multi-word commands like "thank you"
+    category = COMMAND_TO_CATEGORY.get(text_lower)
+    if category is not None:
+        return category
     
-    return "freeform"
+    # One lookup per word; the highest-priority category wins
+    return min(
+        filter(None, map(COMMAND_TO_CATEGORY.get, text_lower.split())),
+        key=CATEGORY_PRIORITY.__getitem__,
+        default="freeform"
+    )
 
 
 def extract_word_timing(vosk_result: Dict) -> List[Dict[str, Any]]:
@@ -427,101 +958,397 @@ def extract_word_timing(vosk_result: Dict) -> List[Dict[str, Any]]:
     Returns:
         List of word timing dictionaries
     """
-    words = []
-    if 'result' in vosk_result and vosk_result['result']:
-        for word_info in vosk_result['result']:
-            words.append({
-                "word": word_info.get('word', ''),
-                "startTime": round(word_info.get('start', 0), 3),
-                "endTime": round(word_info.get('end', 0), 3),
-                "confidence": round(word_info.get('conf', 0.5), 3)
-            })
-    return words
+    return [
+        {
+            "word": word_info.get('word', ''),
+            "startTime": round(word_info.get('start', 0), 3),
+            "endTime": round(word_info.get('end', 0), 3),
+            "confidence": round(word_info.get('conf', 0.5), 3)
+        }
+        for word_info in vosk_result.get('result') or ()
+    ]
 
 
-def recognize_with_fallback(
-    recognizer: sr.Recognizer, 
-    audio: sr.AudioData, 
-    metadata: Dict[str, Any],
-    command_mode: bool = False
-) -> Dict[str, Any]:
+class ServiceResult(NamedTuple):
+    """Outcome of a single recognition service call."""
+    service: str
+    text: Optional[str] = None
+    confidence: float = 0.0
+    processing_time: int = 0
+    word_timing: Optional[List[Dict[str, Any]]] = None
+    error: Optional[str] = None
+
+
+def get_cached_transcript(key: Tuple[bytes, int, str, bool]) -> Optional[ServiceResult]:
     """
-    Try multiple recognition services with fallback.
+    Look up a previous successful service result for identical audio.
+    
+    Args:
+        key: Tuple of (audio digest, sample rate, service, command mode)
+        
+    Returns:
+        Cached ServiceResult or None on a miss
+    """
+    with TRANSCRIPT_CACHE_LOCK:
+        result = TRANSCRIPT_CACHE.get(key)
+        if result is not None:
+            TRANSCRIPT_CACHE.move_to_end(key)
+        return result
+
+
+def cache_transcript(key: Tuple[bytes, int, str, bool], result: ServiceResult) -> None:
+    """
+    Store a successful service result, evicting the least recently used.
+    
+    Args:
+        key: Tuple of (audio digest, sample rate, service, command mode)
+        result: ServiceResult to cache
+    """
+    with TRANSCRIPT_CACHE_LOCK:
+        TRANSCRIPT_CACHE[key] = result
+        TRANSCRIPT_CACHE.move_to_end(key)
+        if len(TRANSCRIPT_CACHE) > TRANSCRIPT_CACHE_SIZE:
+            TRANSCRIPT_CACHE.popitem(last=False)
+
+
+class KeepAliveHTTPHandler(urllib.request.HTTPHandler):
+    """
+    urllib HTTP handler that keeps connections open between requests.
+    
+    urllib's own handler sends "Connection: close" and opens a new
+    connection for every request. sr.Recognizer.recognize_google goes
+    through urllib.request.urlopen, so installing this handler (see
+    install_keepalive_opener) lets a long-lived worker pay the TCP handshake once instead of per request,
+    while the library keeps its own endpoint, key and result handling.
+    HTTPS requests still go through urllib's default handler.
+    """
+    
+    def __init__(self, max_idle: int = 2):
+        super().__init__()
+        self.max_idle = max_idle
+        self.idle: Dict[str, List[http.client.HTTPConnection]] = {}
+        self.lock = threading.Lock()
+    
+    def http_open(self, req: urllib.request.Request) -> urllib.response.addinfourl:
+        """
+        Send a request over an idle connection to its host, or a new one.
+        
+        A reused connection the server has since closed is retried once
+        on a fresh one. The body is read before returning, so the
+        connection can go back to the pool straight away.
+        
+        Args:
+            req: Prepared urllib request
+            
+        Returns:
+            Response for the rest of urllib's handler chain
+            
+        Raises:
+            urllib.error.URLError: If the request cannot be sent or answered
+        """
+        host = req.host
+        if not host:
+            raise urllib.error.URLError('no host given')
+        timeout = req.timeout
+        if timeout is socket._GLOBAL_DEFAULT_TIMEOUT:
+            timeout = socket.getdefaulttimeout()
+        headers = dict(req.unredirected_hdrs)
+        headers.update((k, v) for k, v in req.headers.items() if k not in headers)
+        
+        while True:
+            with self.lock:
+                idle = self.idle.get(host)
+                conn = idle.pop() if idle else None
+            reused = conn is not None
+            if conn is None:
+                conn = http.client.HTTPConnection(host, timeout=timeout)
+            else:
+                # The socket keeps the timeout it connected with; use this request's
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+            
+            try:
+                conn.request(req.get_method(), req.selector, req.data, headers)
+                response = conn.getresponse()
+                body = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as e:
+                conn.close()
+                if reused:
+                    continue
+                raise urllib.error.URLError(e)
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                raise urllib.error.URLError(e)
+            break
+        
+        if response.will_close:
+            conn.close()
+        else:
+            with self.lock:
+                idle = self.idle.setdefault(host, [])
+                if len(idle) < self.max_idle:
+                    idle.append(conn)
+                    conn = None
+            if conn is not None:
+                conn.close()
+        
+        result = urllib.response.addinfourl(io.BytesIO(body), response.msg, req.full_url, response.status)
+        result.msg = response.reason
+        return result
+
+
+def install_keepalive_opener() -> None:
+    """
+    Route urllib.request.urlopen through pooled keep-alive connections.
+    
+    This replaces the process-wide default urlopen opener, so it is left
+    to long-lived entry points (speech_server.serve) to opt in; importing
+    this module changes nothing. Every plain-HTTP urlopen call in the
+    process, Google Web Speech included, then reuses connections.
+    """
+    urllib.request.install_opener(urllib.request.build_opener(KeepAliveHTTPHandler()))
+
+
+def try_google_recognition(recognizer: sr.Recognizer, audio: sr.AudioData) -> ServiceResult:
+    """
+    Run Google Speech Recognition and report the outcome.
     
     Args:
         recognizer: SpeechRecognition Recognizer instance
         audio: AudioData to recognize
-        metadata: Audio metadata to include in response
-        command_mode: If True, optimize for AAC commands
         
     Returns:
-        Recognition result dictionary with standardized camelCase keys
+        ServiceResult with either text or error set
     """
-    errors = []
-    start_time = time.time()
+    start_time = time.monotonic_ns()
+    try:
+        log_debug("Trying Google Speech Recognition...")
+        text = recognizer.recognize_google(audio, show_all=False)
+        log_debug(f"Google succeeded: {text}")
+        result = ServiceResult(
+            service="google",
+            text=text,
+            confidence=0.85  # Google doesn't provide confidence, estimate high
+        )
+    except sr.UnknownValueError:
+        log_debug("Google: Could not understand audio")
+        result = ServiceResult(service="google", error="Could not understand audio")
+    except sr.RequestError as e:
+        log_debug(f"Google RequestError: {e}")
+        result = ServiceResult(service="google", error=str(e))
+    except Exception as e:
+        log_debug(f"Google unexpected error: {type(e).__name__}: {e}")
+        result = ServiceResult(service="google", error=str(e))
+    
+    processing_time = elapsed_ms(start_time)
+    log_debug(f"Google finished in {processing_time}ms")
+    return result._replace(processing_time=processing_time)
 
-    # Try Google Speech Recognition first (usually more accurate for free-form speech)
-    if not command_mode:
-        try:
-            log_debug("Trying Google Speech Recognition...")
-            text = recognizer.recognize_google(audio, show_all=False)
-            processing_time = int((time.time() - start_time) * 1000)
-            log_debug(f"Google succeeded in {processing_time}ms: {text}")
-            
-            return build_success_response(
-                text=text,
-                service="google",
-                confidence=0.85,  # Google doesn't provide confidence, estimate high
-                metadata=metadata,
-                processing_time=processing_time,
-                command_mode=command_mode
-            )
-        except sr.UnknownValueError:
-            log_debug("Google: Could not understand audio")
-            errors.append({"service": "google", "error": "Could not understand audio"})
-        except sr.RequestError as e:
-            log_debug(f"Google RequestError: {e}")
-            errors.append({"service": "google", "error": str(e)})
-        except Exception as e:
-            log_debug(f"Google unexpected error: {type(e).__name__}: {e}")
-            errors.append({"service": "google", "error": str(e)})
+
+def try_vosk_recognition(
+    audio: sr.AudioData,
+    command_mode: bool = False,
+    model: Optional[Any] = None,
+    cancel_event: Optional[threading.Event] = None
+) -> ServiceResult:
+    """
+    Run Vosk offline recognition and report the outcome.
     
-    # Try Vosk (offline) - preferred for command mode
+    Args:
+        audio: AudioData to recognize
+        command_mode: If True, use limited AAC command vocabulary
+        model: Already-loaded Vosk model, loaded here if omitted
+        cancel_event: Set once another service has won; decoding is
+            skipped if it is set before decoding starts
+        
+    Returns:
+        ServiceResult with either text or error set
+    """
+    start_time = time.monotonic_ns()
     try:
         log_debug("Trying Vosk offline recognition...")
-        model = load_vosk_model(vosk_model_path)
+        if model is None:
+            model = load_vosk_model(vosk_model_path)
         
         if model is None:
             raise RuntimeError("Vosk model not available")
         
-        text, confidence, full_result = recognize_vosk(audio, model, command_mode)
-        processing_time = int((time.time() - start_time) * 1000)
+        # A running decode cannot be interrupted, but a slow model load can
+        # finish after the race is already decided
+        if cancel_event is not None and cancel_event.is_set():
+            raise RuntimeError("Cancelled, another service answered first")
+        
+        text, confidence, word_timing = recognize_vosk(audio, model, command_mode)
 
         if text:
-            log_debug(f"Vosk succeeded in {processing_time}ms: {text}")
-            
-            # Extract word timing
-            word_timing = extract_word_timing(full_result)
-            
-            return build_success_response(
-                text=text,
+            log_debug(f"Vosk succeeded: {text}")
+            result = ServiceResult(
                 service="vosk",
+                text=text,
                 confidence=confidence,
-                metadata=metadata,
-                processing_time=processing_time,
-                command_mode=command_mode,
                 word_timing=word_timing
             )
         else:
             log_debug("Vosk: No text recognized")
-            errors.append({"service": "vosk", "error": "Could not understand audio"})
-            
+            result = ServiceResult(service="vosk", error="Could not understand audio")
     except Exception as e:
         log_debug(f"Vosk error: {type(e).__name__}: {e}")
-        errors.append({"service": "vosk", "error": str(e)})
+        result = ServiceResult(service="vosk", error=str(e))
+    
+    processing_time = elapsed_ms(start_time)
+    log_debug(f"Vosk finished in {processing_time}ms")
+    return result._replace(processing_time=processing_time)
+
+
+def select_service_result(
+    service_names: List[str],
+    results: Dict[str, ServiceResult],
+    grace_expired: bool = False
+) -> Optional[ServiceResult]:
+    """
+    Pick the winning service result from those completed so far.
+    
+    A success is accepted once every preferred service ahead of it has
+    failed, or once the grace period for preferred services has run out.
+    Confidence does not jump the queue: Google's is a fixed estimate, so
+    a confident fallback would otherwise always beat it.
+    
+    Args:
+        service_names: Service names in preference order
+        results: Completed service results keyed by service name
+        grace_expired: If True, stop waiting on preferred services
+        
+    Returns:
+        Winning service result, or None if no decision can be made yet
+    """
+    waiting_on_preferred = False
+    for name in service_names:
+        service_result = results.get(name)
+        if service_result is None:
+            waiting_on_preferred = True
+            continue
+        if service_result.error is not None:
+            continue
+        if not waiting_on_preferred or grace_expired:
+            return service_result
+    return None
+
+
+def recognize_with_fallback(
+    recognizer: sr.Recognizer, 
+    audio: sr.AudioData, 
+    metadata: Dict[str, Any],
+    command_mode: bool = False
+) -> Dict[str, Any]:
+    """
+    Try multiple recognition services with fallback.
+    
+    The services run concurrently and the first decisive result wins, so
+    wall-clock latency is usually that of the fastest backend rather than
+    the sum of all of them. Results are still chosen in preference order
+    (Google first for free-form speech, Vosk only in command mode), but a
+    fallback success waits at most PREFERRED_SERVICE_GRACE for them.
+    
+    Args:
+        recognizer: SpeechRecognition Recognizer instance
+        audio: AudioData to recognize
+        metadata: Audio metadata to include in response
+        command_mode: If True, optimize for AAC commands
+        
+    Returns:
+        Recognition result dictionary with standardized camelCase keys
+    """
+    start_time = time.monotonic_ns()
+
+    # Repeated audio (e.g. the same AAC button press) is served from cache
+    audio_digest = hashlib.blake2b(audio.frame_data, digest_size=16).digest()
+
+    def run_cached(name, run):
+        key = (audio_digest, audio.sample_rate, name, command_mode)
+        cached = get_cached_transcript(key)
+        if cached is not None:
+            log_debug(f"{name}: using cached transcription")
+            return cached
+        service_result = run()
+        if service_result.error is None:
+            cache_transcript(key, service_result)
+        return service_result
+
+    # Google is usually more accurate for free-form speech; Vosk (offline) is
+    # preferred for command mode
+    services = []
+    if not command_mode:
+        services.append(("google", lambda: try_google_recognition(recognizer, audio)))
+    # A model that is already loaded is handed over directly; otherwise the
+    # Vosk thread loads it, overlapping the load with the Google request
+    model = VOSK_MODEL
+    cancel_event = threading.Event()
+    services.append(("vosk", lambda: try_vosk_recognition(audio, command_mode, model, cancel_event)))
+
+    service_names = [name for name, _ in services]
+    results = {}
+    winner = None
+
+    # Bound the whole race by the recognizer's timeout, not just each service
+    timeout = recognizer.operation_timeout
+    deadline = time.monotonic() + timeout if timeout else None
+    # Set once a result is only waiting on preferred services
+    grace_deadline = None
+
+    pending = {}
+    try:
+        for name, run in services:
+            pending[RECOGNITION_EXECUTOR.submit(run_cached, name, run)] = name
+        while pending and winner is None:
+            wait_until = min(filter(None, (deadline, grace_deadline)), default=None)
+            remaining = max(0.0, wait_until - time.monotonic()) if wait_until else None
+            done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[pending.pop(future)] = future.result()
+            now = time.monotonic()
+            grace_expired = grace_deadline is not None and now >= grace_deadline
+            winner = select_service_result(service_names, results, grace_expired)
+            if winner is not None:
+                if pending:
+                    log_debug(f"{winner.service}: accepted without waiting for {list(pending.values())}")
+            elif deadline is not None and now >= deadline:
+                break
+            elif grace_deadline is None and any(r.error is None for r in results.values()):
+                grace_deadline = now + PREFERRED_SERVICE_GRACE
+    finally:
+        # Don't block on slower services once a result has been chosen.
+        # Future.cancel() only stops tasks that have not started, so running
+        # services are told through the event instead.
+        cancel_event.set()
+        for future in pending:
+            future.cancel()
+
+    if winner is None and pending:
+        # Out of time: settle for the best result that did arrive
+        for name in pending.values():
+            log_debug(f"{name}: timed out after {timeout}s")
+            results[name] = ServiceResult(service=name, error=f"Timed out after {timeout}s")
+        winner = select_service_result(service_names, results)
+
+    processing_time = elapsed_ms(start_time)
+
+    if winner is not None:
+        return build_success_response(
+            text=winner.text,
+            service=winner.service,
+            confidence=winner.confidence,
+            metadata=metadata,
+            processing_time=processing_time,
+            command_mode=command_mode,
+            word_timing=winner.word_timing
+        )
     
     # All services failed
-    processing_time = int((time.time() - start_time) * 1000)
+    errors = [
+        {"service": results[name].service, "error": results[name].error}
+        for name in service_names
+    ]
     log_debug(f"All services failed after {processing_time}ms")
     
     return build_error_response(
@@ -537,6 +1364,24 @@ def recognize_with_fallback(
 # Response Builders
 # =============================================================================
 
+def build_audio_section(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the camelCase "audio" block shared by every response.
+    
+    Args:
+        metadata: Audio metadata collected by process_audio
+        
+    Returns:
+        Audio section dictionary
+    """
+    return {
+        "duration": metadata.get('duration'),
+        "sampleRate": metadata.get('sampleRate'),
+        "format": metadata.get('format', 'WAV'),
+        "channels": metadata.get('channels', 1)
+    }
+
+
 def build_success_response(
     text: str,
     service: str,
@@ -572,12 +1417,7 @@ def build_success_response(
         "processingTimeMs": processing_time,
         
         # Audio metadata (camelCase)
-        "audio": {
-            "duration": metadata.get('duration'),
-            "sampleRate": metadata.get('sampleRate') or metadata.get('sample_rate'),
-            "format": metadata.get('format', 'WAV'),
-            "channels": metadata.get('channels', 1)
-        },
+        "audio": build_audio_section(metadata),
         
         # AAC-specific fields
         "aac": {
@@ -630,12 +1470,7 @@ def build_error_response(
             "message": error_message
         },
         
-        "audio": {
-            "duration": metadata.get('duration'),
-            "sampleRate": metadata.get('sampleRate') or metadata.get('sample_rate'),
-            "format": metadata.get('format', 'WAV'),
-            "channels": metadata.get('channels', 1)
-        }
+        "audio": build_audio_section(metadata)
     }
     
     if error_details:
@@ -647,6 +1482,26 @@ def build_error_response(
     return response
 
 
+def build_general_error_response(error_message: str) -> Dict[str, Any]:
+    """
+    Build the minimal error response used when processing could not start.
+    
+    Args:
+        error_message: Human-readable error message
+        
+    Returns:
+        Error response dictionary
+    """
+    return {
+        "success": False,
+        "transcription": None,
+        "error": {
+            "code": "GENERAL_ERROR",
+            "message": error_message
+        }
+    }
+
+
 def get_suggested_actions(text: str, command_type: str) -> List[str]:
     """
     Get suggested follow-up actions based on recognized command.
@@ -658,23 +1513,97 @@ def get_suggested_actions(text: str, command_type: str) -> List[str]:
     Returns:
         List of suggested action strings
     """
-    suggestions = {
-        "navigation": ["confirm_navigation", "show_menu", "go_back"],
-        "selection": ["confirm_selection", "cancel", "show_options"],
-        "communication": ["send_message", "repeat", "edit"],
-        "media": ["adjust_volume", "skip", "stop"]
-    }
-    return suggestions.get(command_type, [])
+    return list(SUGGESTED_ACTIONS.get(command_type, ()))
 
 
 # =============================================================================
 # Main Entry Point
 # =============================================================================
 
+def decode_with_soundfile(audio_bytes: bytes, metadata: Dict[str, Any]) -> Optional[sr.AudioData]:
+    """
+    Decode FLAC/OGG/WAV in-process with libsndfile to mono 16-bit PCM.
+    
+    Fills in sampleRate, sampleWidth, channels and duration in metadata.
+    
+    Args:
+        audio_bytes: Raw audio bytes
+        metadata: Audio metadata, updated in place
+        
+    Returns:
+        Decoded AudioData, or None if soundfile is unavailable or fails
+    """
+    try:
+        import soundfile  # Optional libsndfile binding, imported only when needed
+    except ImportError:
+        return None
+    
+    try:
+        data, sample_rate = soundfile.read(io.BytesIO(audio_bytes), dtype='int16', always_2d=False)
+    except Exception as e:
+        log_debug(f"soundfile decode failed: {e}, falling back to AudioFile")
+        return None
+    
+    channels = 1
+    if data.ndim == 2:
+        channels = data.shape[1]
+        data = data.mean(axis=1).astype(np.int16)
+    
+    metadata.setdefault('sampleRate', sample_rate)
+    metadata.setdefault('sampleWidth', 2)
+    metadata.setdefault('channels', channels)
+    metadata.setdefault('duration', round(len(data) / sample_rate, 3) if sample_rate > 0 else 0)
+    return sr.AudioData(data.tobytes(), sample_rate, 2)
+
+
+def load_audio_file(
+    recognizer: sr.Recognizer,
+    audio_file: io.BytesIO,
+    metadata: Dict[str, Any]
+) -> sr.AudioData:
+    """
+    Decode audio through SpeechRecognition for inputs that are not plain PCM WAV.
+    
+    Fills in any sampleRate, sampleWidth and duration missing from metadata.
+    The clip is read whole: ambient noise calibration would consume its
+    first samples, and the energy threshold it sets only matters to
+    listen(), never to record() or the recognizers.
+    
+    Args:
+        recognizer: SpeechRecognition Recognizer instance
+        audio_file: BytesIO object containing the audio
+        metadata: Audio metadata, updated in place
+        
+    Returns:
+        Decoded AudioData
+    """
+    with sr.AudioFile(audio_file) as source:
+        # Record audio
+        audio = recognizer.record(source)
+
+        # Update metadata if not set
+        if 'sampleRate' not in metadata:
+            metadata['sampleRate'] = source.SAMPLE_RATE
+        if 'sampleWidth' not in metadata:
+            metadata['sampleWidth'] = source.SAMPLE_WIDTH
+        if 'duration' not in metadata:
+            metadata['duration'] = round(
+                len(audio.frame_data) / (source.SAMPLE_RATE * source.SAMPLE_WIDTH), 
+                3
+            )
+    return audio
+
+
+# Keys trusted metadata needs before header parsing can be skipped
+TRUSTED_METADATA_FIELDS = frozenset({'format', 'sampleRate', 'channels', 'sampleWidth', 'duration'})
+
+
 def process_audio(
     audio_bytes: bytes,
     command_mode: bool = False,
-    skip_preprocessing: bool = False
+    skip_preprocessing: bool = False,
+    use_simple_filter: bool = False,
+    trusted_metadata: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """
     Process audio bytes and return recognition result.
@@ -686,21 +1615,20 @@ def process_audio(
         audio_bytes: Raw audio bytes
         command_mode: If True, optimize for AAC command recognition
         skip_preprocessing: If True, skip audio preprocessing
+        use_simple_filter: If True, preprocess with the cheaper one-pole filter
+        trusted_metadata: Metadata already known to an in-process caller, in
+            the get_wav_metadata layout. When it has every key in
+            TRUSTED_METADATA_FIELDS, format detection and header parsing
+            are skipped; otherwise the audio is parsed as usual.
         
     Returns:
         Recognition result dictionary
     """
-    start_time = time.time()
-    
-    recognizer = sr.Recognizer()
+    start_time = time.monotonic_ns()
+    timer = StageTimer()
     
-    # Configure recognizer for AAC context (optimized for quick responses)
-    recognizer.energy_threshold = 300
-    recognizer.dynamic_energy_threshold = True
-    recognizer.pause_threshold = 0.4  # Shorter for faster response
-    recognizer.phrase_threshold = 0.2
-    recognizer.non_speaking_duration = 0.2
-    recognizer.operation_timeout = 10  # Reduced timeout for AAC responsiveness
+    # Shared, preconfigured recognizer
+    recognizer = RECOGNIZER
 
     if len(audio_bytes) == 0:
         return build_error_response(
@@ -710,120 +1638,276 @@ def process_audio(
             processing_time=0
         )
 
-    # Detect format
-    audio_format = detect_audio_format(audio_bytes)
-    log_debug(f"Detected audio format: {audio_format}")
-
-    # Get audio metadata
-    metadata = {}
-    audio_file = io.BytesIO(audio_bytes)
+    audio = None
+    if trusted_metadata is not None and TRUSTED_METADATA_FIELDS.issubset(trusted_metadata):
+        # The caller already knows what it is sending; copy so the
+        # response builders can fill in fields without touching its dict
+        metadata = dict(trusted_metadata)
+        audio_format = metadata['format']
+    else:
+        if trusted_metadata is not None:
+            log_debug("Trusted metadata is incomplete, parsing the audio instead")
+        # Detect format
+        audio_format = detect_audio_format(audio_bytes)
+        if DEBUG:
+            log_debug(f"Detected audio format: {audio_format}")
+
+        # Get audio metadata
+        metadata = {}
+        if audio_format == 'WAV':
+            metadata = get_wav_metadata(audio_bytes)
+            if DEBUG:
+                log_debug(f"Audio metadata: {metadata}")
 
-    if audio_format == 'WAV':
-        metadata = get_wav_metadata(audio_file)
-        audio_file.seek(0)
-        log_debug(f"Audio metadata: {metadata}")
-    
     try:
+        if audio_format == 'WAV':
+            # Uncompressed PCM needs no decoding; build AudioData from the data chunk
+            pcm = extract_wav_pcm(audio_bytes, metadata)
+            if pcm is not None:
+                audio = sr.AudioData(pcm, metadata['sampleRate'], 2)
+        
         # Load audio for recognition
-        with sr.AudioFile(audio_file) as source:
-            # Quick ambient noise calibration
-            if metadata.get('duration', 0) > 0.3:
-                adjust_ambient_noise(recognizer, source, duration=0.2)
-
-            # Record audio
-            audio = recognizer.record(source)
-
-            # Update metadata if not set
-            if 'sampleRate' not in metadata:
-                metadata['sampleRate'] = source.SAMPLE_RATE
-            if 'sampleWidth' not in metadata:
-                metadata['sampleWidth'] = source.SAMPLE_WIDTH
-            if 'duration' not in metadata:
-                metadata['duration'] = round(
-                    len(audio.frame_data) / (source.SAMPLE_RATE * source.SAMPLE_WIDTH), 
-                    3
-                )
+        if audio is None and audio_format in ('WAV', 'FLAC', 'OGG'):
+            audio = decode_with_soundfile(audio_bytes, metadata)
+            if audio is not None and 'format' not in metadata:
+                metadata['format'] = audio_format
+        if audio is None:
+            # Only the SpeechRecognition decoder needs a file-like object
+            audio = load_audio_file(recognizer, io.BytesIO(audio_bytes), metadata)
+        timer.mark("decode")
             
-            # Validate audio quality
-            validation = validate_audio_quality(
-                audio, 
-                metadata['sampleRate'], 
-                metadata['duration']
-            )
+        # Validate audio quality
+        stats = audio_stats(audio.frame_data, audio.sample_width)
+        validation = validate_audio_quality(
+            audio, 
+            metadata['sampleRate'], 
+            metadata['duration'],
+            stats=stats
+        )
+        timer.mark("validation")
 
-            if not validation['valid']:
-                processing_time = int((time.time() - start_time) * 1000)
-                return build_error_response(
-                    error_code="AUDIO_QUALITY_ISSUES",
-                    error_message="; ".join(validation['issues']),
-                    metadata=metadata,
-                    processing_time=processing_time,
-                    warnings=validation['warnings']
-                )
-            
-            # Preprocess audio (unless skipped)
-            if not skip_preprocessing:
-                audio = preprocess_audio(recognizer, audio)
+        if not validation['valid']:
+            processing_time = elapsed_ms(start_time)
+            return build_error_response(
+                error_code="AUDIO_QUALITY_ISSUES",
+                error_message="; ".join(validation['issues']),
+                metadata=metadata,
+                processing_time=processing_time,
+                warnings=validation['warnings']
+            )
+        
+        # Convert once to the native rate shared by every backend. The
+        # validation peak only still holds if no resampling took place.
+        resampled = resample_audio(audio)
+        peak = stats[1] if stats and resampled is audio else None
+
+        # Drop silent padding. Trimming only removes quiet frames, so it
+        # never raises the peak.
+        audio = trim_silence(resampled)
+        timer.mark("resample_trim")
+
+        # Preprocess audio (unless skipped). The command grammar is robust
+        # enough that command mode goes straight to the recognizer.
+        if not skip_preprocessing and not command_mode:
+            audio = preprocess_audio(
+                recognizer,
+                audio,
+                peak=peak,
+                use_simple_filter=use_simple_filter
+            )
+            timer.mark("preprocess")
 
-            # Recognize with fallback
-            result = recognize_with_fallback(recognizer, audio, metadata, command_mode)
+        # Recognize with fallback
+        result = recognize_with_fallback(recognizer, audio, metadata, command_mode)
+        timer.mark("recognition")
 
-            # Add validation warnings if any
-            if validation['warnings']:
-                result['warnings'] = validation['warnings']
-            
-            return result
+        # Add validation warnings if any
+        if validation['warnings']:
+            result['warnings'] = validation['warnings']
+        
+        return result
             
     except Exception as e:
         log_debug(f"Exception in process_audio: {type(e).__name__}: {e}")
-        processing_time = int((time.time() - start_time) * 1000)
+        processing_time = elapsed_ms(start_time)
         return build_error_response(
             error_code="PROCESSING_ERROR",
             error_message=str(e),
             metadata=metadata,
             processing_time=processing_time
         )
+    finally:
+        timer.log()
+
+
+def serialize_result(result: Dict[str, Any]) -> bytes:
+    """
+    Serialize a result dictionary to one newline-terminated line of JSON.
+    
+    Args:
+        result: Response dictionary
+        
+    Returns:
+        UTF-8 encoded JSON line
+    """
+    if orjson is not None:
+        return orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(result) + '\n').encode('utf-8')
+
+
+def write_result(result: Dict[str, Any]) -> None:
+    """
+    Write a result as one line of JSON to stdout.
+    
+    Args:
+        result: Response dictionary to emit
+    """
+    sys.stdout.buffer.write(serialize_result(result))
+    sys.stdout.buffer.flush()
+
+
+def fill_buffer(raw: io.RawIOBase, view: memoryview) -> int:
+    """
+    Fill a buffer from an unbuffered stream until it is full or EOF.
+    
+    Args:
+        raw: Unbuffered binary stream
+        view: Writable view of the destination buffer
+        
+    Returns:
+        Number of bytes read
+    """
+    filled = 0
+    while filled < len(view):
+        count = raw.readinto(view[filled:])
+        if not count:
+            break
+        filled += count
+    return filled
+
+
+def read_remaining(raw: io.RawIOBase, buffer: bytearray) -> bytearray:
+    """
+    Append everything left in an unbuffered stream using large reads.
+    
+    Args:
+        raw: Unbuffered binary stream
+        buffer: Buffer to extend
+        
+    Returns:
+        The extended buffer
+    """
+    while True:
+        chunk = raw.read(AUDIO_READ_CHUNK)
+        if not chunk:
+            return buffer
+        buffer += chunk
 
 
-def main():
-    """Main entry point when run from command line."""
+def read_audio_input(fd: int) -> bytearray:
+    """
+    Read an audio payload from a file descriptor into a single buffer.
+    
+    Reads go straight to the descriptor in large blocks, bypassing the
+    small reads of a buffered stream. For WAV input the RIFF header
+    announces the total size, so the buffer is allocated once and filled
+    in place instead of growing as chunks arrive. Other formats fall back
+    to reading until EOF.
+    
+    Args:
+        fd: File descriptor to read from (e.g. sys.stdin.fileno())
+        
+    Returns:
+        Audio bytes
+    """
+    raw = io.FileIO(fd, 'rb', closefd=False)
+    header = bytearray(12)
+    with memoryview(header) as view:
+        count = fill_buffer(raw, view)
+    del header[count:]
+    
+    if len(header) < 12 or header[0:4] != b'RIFF' or header[8:12] != b'WAVE':
+        return read_remaining(raw, header)
+    
+    total_size = struct.unpack_from('<I', header, 4)[0] + 8
+    if total_size <= 12 or total_size > MAX_PREALLOCATED_AUDIO_BYTES:
+        # Streaming writers leave the size as 0 or 0xFFFFFFFF
+        return read_remaining(raw, header)
+    
+    buffer = bytearray(total_size)
+    buffer[0:12] = header
+    with memoryview(buffer) as view:
+        filled = 12 + fill_buffer(raw, view[12:])
+    
+    if filled < total_size:
+        del buffer[filled:]
+        return buffer
+    # Keep anything sent past the declared size, as before
+    return read_remaining(raw, buffer)
+
+
+def main(audio_bytes: Optional[bytes] = None):
+    """
+    Main entry point when run from command line.
+    
+    Args:
+        audio_bytes: Audio already read by a caller, or None to read stdin
+    """
     
     # Check for command-line flags
     command_mode = '--command-mode' in sys.argv or os.environ.get('AAC_COMMAND_MODE') == 'true'
     skip_preprocessing = '--skip-preprocessing' in sys.argv
+    use_simple_filter = '--simple-filter' in sys.argv
     
-    # Preload Vosk model if available (reduces first-request latency)
+    # Preload Vosk model if available (reduces first-request latency). This
+    # runs in the background so model loading overlaps the stdin read.
+    warm_up = None
     if os.environ.get('PRELOAD_VOSK', 'true').lower() == 'true':
         log_debug("Preloading Vosk model...")
-        warm_up_models()
+        warm_up = threading.Thread(target=warm_up_models, name="vosk-warm-up", daemon=True)
+        warm_up.start()
+    else:
+        # Still start loading now; the Vosk service waits on the load lock
+        # only if it gets there first
+        log_debug("PRELOAD_VOSK is off: recognizers will be built on first use")
+        threading.Thread(
+            target=load_vosk_model,
+            args=(vosk_model_path,),
+            name="vosk-load",
+            daemon=True
+        ).start()
 
     try:
         # Read audio from stdin
-        audio_bytes = sys.stdin.buffer.read()
+        if audio_bytes is None:
+            audio_bytes = read_audio_input(sys.stdin.fileno())
+        
+        if warm_up is not None:
+            warm_up.join()
         
         # Process audio
         result = process_audio(
             audio_bytes, 
             command_mode=command_mode,
-            skip_preprocessing=skip_preprocessing
+            skip_preprocessing=skip_preprocessing,
+            use_simple_filter=use_simple_filter
         )
         
         # Output result
-        print(json.dumps(result))
-        sys.exit(0 if result['success'] else 1)
+        write_result(result)
+        exit_code = 0 if result['success'] else 1
         
     except Exception as e:
         log_debug(f"Exception in main: {type(e).__name__}: {e}")
-        result = {
-            "success": False,
-            "transcription": None,
-            "error": {
-                "code": "GENERAL_ERROR",
-                "message": str(e)
-            }
-        }
-        print(json.dumps(result))
-        sys.exit(3)
+        write_result(build_general_error_response(str(e)))
+        exit_code = 3
+    
+    # The caller waits for the process to exit, and a normal interpreter
+    # shutdown would join any service that lost the race (e.g. a Google
+    # request still in flight after Vosk answered). Everything has been
+    # written, so leave immediately.
+    sys.stderr.flush()
+    os._exit(exit_code)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+AAC Speech Recognition Client
+=============================
+Drop-in replacement for running speechRecognition.py directly: reads audio
+from stdin and prints the JSON result, but forwards the work to a running
+speech_server.py worker so the model is not reloaded on every request.
+
+Only the standard library is imported on the fast path. If no worker is
+listening, the audio is processed in-process by speechRecognition.py.
+
+Accepts the same flags and environment variables as speechRecognition.py.
+"""
+
+import json
+import os
+import socket
+import sys
+
+DEFAULT_SOCKET_PATH = '/tmp/aac-speech.sock'
+socket_path = os.environ.get('SPEECH_SOCKET_PATH', DEFAULT_SOCKET_PATH)
+
+
+def request_worker(
+    audio_bytes: bytes,
+    command_mode: bool,
+    skip_preprocessing: bool,
+    use_simple_filter: bool
+) -> bytes:
+    """
+    Send one transcription request to the worker.
+
+    Args:
+        audio_bytes: Raw audio bytes
+        command_mode: If True, optimize for AAC command recognition
+        skip_preprocessing: If True, skip audio preprocessing
+        use_simple_filter: If True, preprocess with the cheaper one-pole filter
+
+    Returns:
+        The worker's JSON response line
+
+    Raises:
+        OSError: If the worker is not reachable
+    """
+    header = json.dumps({
+        "length": len(audio_bytes),
+        "commandMode": command_mode,
+        "skipPreprocessing": skip_preprocessing,
+        "simpleFilter": use_simple_filter
+    }).encode('utf-8')
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(header + b'\n')
+        sock.sendall(audio_bytes)
+        with sock.makefile('rb') as response:
+            line = response.readline()
+
+    if not line:
+        raise ConnectionError("Worker closed the connection without a response")
+    return line
+
+
+def main():
+    """Main entry point when run from command line."""
+    command_mode = '--command-mode' in sys.argv or os.environ.get('AAC_COMMAND_MODE') == 'true'
+    skip_preprocessing = '--skip-preprocessing' in sys.argv
+    use_simple_filter = '--simple-filter' in sys.argv
+
+    audio_bytes = sys.stdin.buffer.read()
+
+    try:
+        if not hasattr(socket, 'AF_UNIX'):
+            raise OSError("Unix domain sockets are not available")
+        line = request_worker(audio_bytes, command_mode, skip_preprocessing, use_simple_filter)
+    except OSError:
+        # No worker running: do the work here, exactly as the script would
+        import speechRecognition
+        speechRecognition.main(audio_bytes)
+        return
+
+    sys.stdout.buffer.write(line)
+    sys.stdout.buffer.flush()
+    result = json.loads(line)
+    sys.exit(0 if result.get('success') else 1)
+
+
+if __name__ == "__main__":
+    main()
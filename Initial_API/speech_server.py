@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+AAC Speech Recognition Worker
+=============================
+Long-lived worker that keeps the Vosk model and recognizers loaded between
+requests, so each transcription costs a socket round trip instead of a
+Python start-up plus model load.
+
+Protocol (one request per connection, over a Unix domain socket):
+- Request: one JSON header line, e.g.
+  {"length": 32044, "commandMode": false, "skipPreprocessing": false,
+   "simpleFilter": false}
+  followed by exactly `length` bytes of audio, at most MAX_REQUEST_BYTES
+- Response: one line of JSON, the same result speechRecognition.py prints
+
+Each connection gets its own thread. KaldiRecognizers are checked out
+of a pool per decode, so requests can overlap; at most
+MAX_CONCURRENT_REQUESTS are recognized at once so the shared
+recognition executor is not oversubscribed.
+
+Usage:
+    python speech_server.py                 # listen on SPEECH_SOCKET_PATH
+    python speech_client.py < audio.wav     # forward one request
+"""
+
+import os
+import socketserver
+import sys
+import threading
+from typing import Any, Dict
+
+import speechRecognition as speech
+
+DEFAULT_SOCKET_PATH = '/tmp/aac-speech.sock'
+socket_path = os.environ.get('SPEECH_SOCKET_PATH', DEFAULT_SOCKET_PATH)
+
+# Two services per request on a four-thread executor
+MAX_CONCURRENT_REQUESTS = 2
+REQUEST_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+# Largest audio payload a request may declare; it is buffered in memory
+MAX_REQUEST_BYTES = speech.MAX_PREALLOCATED_AUDIO_BYTES
+
+
+class SpeechRequestHandler(socketserver.StreamRequestHandler):
+    """Handle a single length-prefixed transcription request."""
+
+    def handle(self) -> None:
+        try:
+            header: Dict[str, Any] = speech.json_loads(self.rfile.readline())
+            if 'length' not in header:
+                raise ValueError("Request header has no length")
+            length = int(header['length'])
+            if not 0 <= length <= MAX_REQUEST_BYTES:
+                raise ValueError(f"Request length must be between 0 and {MAX_REQUEST_BYTES} bytes")
+            audio_bytes = self.rfile.read(length)
+            with REQUEST_SLOTS:
+                result = speech.process_audio(
+                    audio_bytes,
+                    command_mode=bool(header.get('commandMode', False)),
+                    skip_preprocessing=bool(header.get('skipPreprocessing', False)),
+                    use_simple_filter=bool(header.get('simpleFilter', False))
+                )
+        except Exception as e:
+            speech.log_debug(f"Exception in worker: {type(e).__name__}: {e}")
+            result = speech.build_general_error_response(str(e))
+        self.wfile.write(speech.serialize_result(result))
+
+
+def serve(path: str = socket_path) -> None:
+    """
+    Warm up models and serve requests until interrupted.
+    
+    Also installs pooled keep-alive connections as this process's
+    default urllib opener, so Google requests skip the TCP handshake.
+
+    Args:
+        path: Filesystem path of the Unix domain socket
+    """
+    speech.log_debug("Preloading Vosk model...")
+    speech.warm_up_models()
+    # Reuse Google connections across requests (replaces urllib's default opener)
+    speech.install_keepalive_opener()
+
+    # Remove a stale socket left behind by a previous worker
+    if os.path.exists(path):
+        os.unlink(path)
+
+    with socketserver.ThreadingUnixStreamServer(path, SpeechRequestHandler) as server:
+        server.daemon_threads = True  # Don't hold up shutdown for open connections
+        print(f"AAC speech worker listening on {path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(path)
+
+
+if __name__ == "__main__":
+    serve()
@@ -12,17 +12,30 @@ Tests the improved speechRecognition.py module with:
 Author: Original by Gio, updated for AAC improvements
 """
 
+import atexit
 import subprocess
 import json
 import os
-import sys
-import wave
+import socket
 import struct
-import math
+import sys
 import tempfile
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Union, BinaryIO
+
+import numpy as np
+
+# Optional faster JSON parser, falls back to the standard library.
+# Both accept bytes, and orjson's decode error subclasses json's.
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
 # ANSI color codes for pretty output
 class Colors:
@@ -34,34 +47,180 @@ class Colors:
     BOLD = '\033[1m'
     END = '\033[0m'
 
+# Checked once: stdout does not change between colored prints
+USE_COLOR = sys.stdout.isatty()
+
 def color(text: str, color_code: str) -> str:
     """Apply color to text if terminal supports it."""
-    if sys.stdout.isatty():
+    if USE_COLOR:
         return f"{color_code}{text}{Colors.END}"
     return text
 
 
+# Response format: required camelCase fields and retired PascalCase ones
+REQUIRED_FIELDS = frozenset({'success', 'transcription'})
+DEPRECATED_FIELDS = frozenset({'Success', 'Transcription', 'Error_code', 'Error_message'})
+AUDIO_FIELDS = frozenset({'duration', 'sampleRate', 'format'})
+ERROR_FIELDS = frozenset({'code', 'message'})
+
+# One generator for all background noise, seeded from the OS once
+NOISE_RNG = np.random.default_rng()
+
+# Debug lines kept from the end of the script's stderr
+STDERR_TAIL_LINES = 5
+
+# Canonical 44-byte header of a PCM WAV file (RIFF, fmt and data chunks)
+WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
+
+def pcm_to_wav(frames: bytes, sample_rate: int, sample_width: int = 2) -> bytes:
+    """
+    Wrap mono PCM frames in a WAV container, in memory.
+    
+    The format is fixed, so the header is packed in one go instead of
+    going through the wave module.
+    
+    Args:
+        frames: Raw PCM samples
+        sample_rate: Sample rate in Hz
+        sample_width: Bytes per sample
+        
+    Returns:
+        WAV file bytes
+    """
+    header = WAV_HEADER.pack(
+        b'RIFF', 36 + len(frames), b'WAVE',
+        b'fmt ', 16, 1, 1,  # PCM, mono
+        sample_rate, sample_rate * sample_width, sample_width, sample_width * 8,
+        b'data', len(frames)
+    )
+    return header + frames
+
+
+def output_wav(wav_bytes: bytes, filename: Optional[Union[str, Path]]) -> Union[str, bytes]:
+    """
+    Save WAV bytes to a file if one is given, otherwise hand them back.
+    
+    Args:
+        wav_bytes: WAV file bytes
+        filename: Output file path, or None to keep the audio in memory
+        
+    Returns:
+        Path to the written file, or the WAV bytes
+    """
+    if filename is None:
+        return wav_bytes
+    with open(filename, 'wb') as wav_file:  # open() takes str and Path alike
+        wav_file.write(wav_bytes)
+    return os.fspath(filename)
+
+
 class SpeechRecognitionTester:
     """Test harness for AAC speech recognition module."""
     
-    def __init__(self, script_path: str = "../speechRecognition.py"):
+    def __init__(self, script_path: str = "../speechRecognition.py", use_worker: bool = False, jobs: int = 4):
         self.script_path = script_path
+        self.use_worker = use_worker
+        self.jobs = jobs  # Recognition requests run_all_tests keeps in flight
         self.test_results: List[Dict[str, Any]] = []
+        # Generated WAV bytes keyed by create_test_wav parameters
+        self.wav_cache: Dict[tuple, bytes] = {}
+        self.worker: Optional[subprocess.Popen] = None
+        self.worker_dir: Optional[tempfile.TemporaryDirectory] = None
+        self.socket_path = ""
+    
+    def start_worker(self, timeout: float = 60.0) -> None:
+        """
+        Start one speech_server.py worker for the whole run.
+        
+        The worker loads Python, its imports and the Vosk model once, so
+        each test pays only for recognition instead of a fresh process.
+        
+        Args:
+            timeout: Seconds to wait for the worker to start listening
+        """
+        if self.worker is not None:
+            return
+        
+        server_path = Path(self.script_path).with_name('speech_server.py')
+        self.worker_dir = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self.worker_dir.name, 'speech.sock')
+        env = dict(os.environ, SPEECH_SOCKET_PATH=self.socket_path)
+        self.worker = subprocess.Popen(
+            [sys.executable, str(server_path)],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        
+        deadline = time.monotonic() + timeout
+        while not os.path.exists(self.socket_path):
+            if self.worker.poll() is not None or time.monotonic() > deadline:
+                self.stop_worker()
+                raise RuntimeError(f"Speech worker did not start ({server_path})")
+            time.sleep(0.05)
+        print(color(f"Using speech worker at {self.socket_path}", Colors.CYAN))
+    
+    def stop_worker(self) -> None:
+        """Stop the worker started by start_worker, if any."""
+        if self.worker is not None:
+            self.worker.terminate()
+            self.worker.wait()
+            self.worker = None
+        if self.worker_dir is not None:
+            self.worker_dir.cleanup()
+            self.worker_dir = None
+    
+    def request_worker(
+        self,
+        audio_data: Union[bytes, BinaryIO],
+        command_mode: bool,
+        timeout: float = 30
+    ) -> bytes:
+        """
+        Send one recognition request to the worker.
+        
+        Args:
+            audio_data: Audio bytes to recognize, or an open audio file.
+                A file is sent with socket.sendfile(), so on Linux its
+                contents go to the socket without being read into Python.
+            command_mode: Whether to use AAC command mode
+            timeout: Socket timeout in seconds
+            
+        Returns:
+            The worker's JSON response line
+        """
+        self.start_worker()
+        if isinstance(audio_data, bytes):
+            length = len(audio_data)
+        else:
+            length = os.fstat(audio_data.fileno()).st_size - audio_data.tell()
+        header = json.dumps({"length": length, "commandMode": command_mode}).encode('utf-8')
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(self.socket_path)
+            sock.sendall(header + b'\n')
+            if isinstance(audio_data, bytes):
+                sock.sendall(audio_data)
+            else:
+                sock.sendfile(audio_data, count=length)
+            with sock.makefile('rb') as response:
+                return response.readline()
     
     def create_test_wav(
         self, 
-        filename: str, 
+        filename: Optional[Union[str, Path]] = None, 
         duration: float = 1.0, 
         frequency: int = 440, 
         sample_rate: int = 16000, 
         silent: bool = False,
         add_noise: bool = False
-    ) -> str:
+    ) -> Union[str, bytes]:
         """
         Create a test WAV file with various audio characteristics.
         
         Args:
-            filename: Output file path
+            filename: Output file path, or None to return the WAV bytes
             duration: Audio duration in seconds
             frequency: Tone frequency in Hz
             sample_rate: Sample rate in Hz
@@ -69,55 +228,54 @@ class SpeechRecognitionTester:
             add_noise: If True, add background noise
             
         Returns:
-            Path to created file
+            Path to created file, or the WAV bytes if no filename was given
         """
+        # Identical parameters give identical audio; reuse instead of regenerating
+        key = (duration, frequency, sample_rate, silent, add_noise)
+        wav_bytes = self.wav_cache.get(key)
+        if wav_bytes is not None:
+            return output_wav(wav_bytes, filename)
+        
         num_samples = int(duration * sample_rate)
         
-        with wave.open(str(filename), 'wb') as wav_file:
-            wav_file.setnchannels(1)  # Mono
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(sample_rate)
+        if silent:
+            # Create silence (zeroed 16-bit samples)
+            frames = bytes(2 * num_samples)
+        else:
+            # Create a sine wave tone
+            t = np.arange(num_samples)
+            samples = (32767.0 * 0.8 * np.sin(2.0 * np.pi * frequency * t / sample_rate)).astype(np.int32)
             
-            if silent:
-                # Create silence
-                frames = struct.pack('h' * num_samples, *[0] * num_samples)
-            else:
-                # Create a sine wave tone
-                samples = []
-                for i in range(num_samples):
-                    value = int(32767.0 * 0.8 * math.sin(2.0 * math.pi * frequency * i / sample_rate))
-                    
-                    # Add noise if requested
-                    if add_noise:
-                        import random
-                        noise = random.randint(-1000, 1000)
-                        value = max(-32767, min(32767, value + noise))
-                    
-                    samples.append(value)
-                
-                frames = struct.pack('h' * num_samples, *samples)
+            # Add noise if requested
+            if add_noise:
+                samples += NOISE_RNG.integers(-1000, 1001, size=num_samples, dtype=np.int32)
+                np.clip(samples, -32767, 32767, out=samples)
             
-            wav_file.writeframes(frames)
+            frames = samples.astype('<i2').tobytes()
         
-        return str(filename)
+        wav_bytes = pcm_to_wav(frames, sample_rate)
+        # Noise is random, so noisy audio is never reused
+        if not add_noise:
+            self.wav_cache[key] = wav_bytes
+        return output_wav(wav_bytes, filename)
     
     def create_speech_like_wav(
         self,
-        filename: str,
+        filename: Optional[Union[str, Path]] = None,
         duration: float = 1.0,
         sample_rate: int = 16000
-    ) -> str:
+    ) -> Union[str, bytes]:
         """
         Create a WAV file with speech-like characteristics (multiple frequencies).
         This won't be recognized as speech, but tests audio processing.
         
         Args:
-            filename: Output file path
+            filename: Output file path, or None to return the WAV bytes
             duration: Audio duration in seconds
             sample_rate: Sample rate in Hz
             
         Returns:
-            Path to created file
+            Path to created file, or the WAV bytes if no filename was given
         """
         num_samples = int(duration * sample_rate)
         
@@ -125,84 +283,145 @@ class SpeechRecognitionTester:
         frequencies = [300, 700, 1200, 2500]
         amplitudes = [0.4, 0.3, 0.2, 0.1]
         
-        with wave.open(str(filename), 'wb') as wav_file:
-            wav_file.setnchannels(1)
-            wav_file.setsampwidth(2)
-            wav_file.setframerate(sample_rate)
+        # Sum the formants: one row per frequency, summed over rows
+        i = np.arange(num_samples)
+        phases = 2.0 * np.pi * np.array(frequencies)[:, None] * i[None, :] / sample_rate
+        value = (np.array(amplitudes)[:, None] * np.sin(phases)).sum(axis=0)
+        
+        # Apply envelope (attack/decay). It is 1.0 outside the two ramps, so
+        # only the ramp samples are scaled.
+        ramp = sample_rate * 0.05
+        ramp_samples = min(num_samples, int(np.ceil(ramp)))
+        tail = num_samples - ramp_samples
+        value[:ramp_samples] *= np.minimum(1.0, i[:ramp_samples] / ramp)  # 50ms attack
+        value[tail:] *= np.minimum(1.0, (num_samples - i[tail:]) / ramp)  # 50ms decay
+        
+        samples = np.clip((32767.0 * value).astype(np.int32), -32767, 32767)
+        
+        frames = samples.astype('<i2').tobytes()
+        
+        return output_wav(pcm_to_wav(frames, sample_rate), filename)
+    
+    def run_recognition(
+        self,
+        audio_data: Union[bytes, BinaryIO],
+        command_mode: bool = False
+    ) -> Tuple[bytes, bytes, float]:
+        """
+        Run one recognition request, without printing anything.
+        
+        Safe to call from several threads at once.
+        
+        Args:
+            audio_data: Audio bytes to recognize, or an open audio file.
+                A file is given to the script as its stdin directly, or
+                streamed to the worker without being read into memory.
+            command_mode: Whether to use AAC command mode
             
-            samples = []
-            for i in range(num_samples):
-                value = 0
-                for freq, amp in zip(frequencies, amplitudes):
-                    value += amp * math.sin(2.0 * math.pi * freq * i / sample_rate)
-                
-                # Apply envelope (attack/decay)
-                envelope = min(1.0, i / (sample_rate * 0.05))  # 50ms attack
-                envelope *= min(1.0, (num_samples - i) / (sample_rate * 0.05))  # 50ms decay
-                
-                value = int(32767.0 * value * envelope)
-                samples.append(max(-32767, min(32767, value)))
+        Returns:
+            Tuple of (stdout, stderr, elapsed milliseconds)
+        """
+        start_time = time.time()
+        if self.use_worker:
+            # Debug output goes to the worker's own stderr
+            stdout, stderr = self.request_worker(audio_data, command_mode), b''
+        else:
+            # Build command
+            cmd = [sys.executable, self.script_path]
+            if command_mode:
+                cmd.append('--command-mode')
             
-            frames = struct.pack('h' * num_samples, *samples)
-            wav_file.writeframes(frames)
-        
-        return str(filename)
+            # Run the speech recognition script. A file is passed as stdin
+            # itself, so it never has to be read into this process.
+            from_file = not isinstance(audio_data, bytes)
+            process = subprocess.Popen(
+                cmd,
+                stdin=audio_data if from_file else subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            )
+            
+            # Only the last few debug lines are shown, so only those are kept
+            # however much the script logs
+            stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+            stdout_chunks = []
+            
+            def feed_stdin():
+                try:
+                    process.stdin.write(audio_data)
+                    process.stdin.close()
+                except (BrokenPipeError, OSError):
+                    pass  # The script exited early; its output says why
+            
+            pipes = [
+                threading.Thread(target=lambda: stdout_chunks.append(process.stdout.read()), daemon=True),
+                threading.Thread(target=lambda: stderr_tail.extend(process.stderr), daemon=True)
+            ]
+            if not from_file:
+                pipes.append(threading.Thread(target=feed_stdin, daemon=True))
+            for pipe in pipes:
+                pipe.start()
+            try:
+                process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                raise
+            finally:
+                for pipe in pipes:
+                    pipe.join()
+            stdout, stderr = b''.join(stdout_chunks), b''.join(stderr_tail)
+        return stdout, stderr, (time.time() - start_time) * 1000
     
     def test_with_audio_file(
         self, 
-        audio_path: str, 
+        audio_path: Union[str, Path, bytes], 
         test_name: str = "",
         command_mode: bool = False,
-        expected_success: Optional[bool] = None
+        expected_success: Optional[bool] = None,
+        response: Optional[Future] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Test the speech recognition with an audio file.
         
         Args:
-            audio_path: Path to audio file
+            audio_path: Path to audio file, or the audio bytes themselves
             test_name: Name for this test
             command_mode: Whether to use AAC command mode
             expected_success: Expected result (for pass/fail reporting)
+            response: Already submitted run_recognition call for this audio,
+                if any; its output is reported instead of running again
             
         Returns:
             Recognition result dictionary or None on error
         """
         print(f"\n{'─'*60}")
-        print(color(f"Testing: {test_name or audio_path}", Colors.BOLD))
+        label = test_name or ("in-memory audio" if isinstance(audio_path, bytes) else audio_path)
+        print(color(f"Testing: {label}", Colors.BOLD))
         if command_mode:
             print(color("  [Command Mode Enabled]", Colors.CYAN))
         print('─'*60)
         
         try:
-            # Read the audio file
-            with open(audio_path, 'rb') as audio_file:
-                audio_data = audio_file.read()
-            
-            # Build command
-            cmd = [sys.executable, self.script_path]
-            if command_mode:
-                cmd.append('--command-mode')
-            
-            # Run the speech recognition script
-            start_time = time.time()
-            process = subprocess.Popen(
-                cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
-            
-            stdout, stderr = process.communicate(input=audio_data, timeout=30)
-            elapsed_time = (time.time() - start_time) * 1000
+            if response is not None:
+                stdout, stderr, elapsed_time = response.result()
+            else:
+                # Generated audio is passed in memory; files are streamed
+                if isinstance(audio_path, bytes):
+                    stdout, stderr, elapsed_time = self.run_recognition(audio_path, command_mode)
+                else:
+                    with open(audio_path, 'rb') as audio_file:
+                        stdout, stderr, elapsed_time = self.run_recognition(audio_file, command_mode)
             
             # Show stderr (debug info)
             if stderr:
-                debug_lines = stderr.decode().strip().split('\n')
-                for line in debug_lines[-5:]:  # Show last 5 debug lines
-                    print(color(f"  [debug] {line}", Colors.YELLOW))
+                # Split from the end and decode only the lines that are shown
+                debug_lines = stderr.strip().rsplit(b'\n', STDERR_TAIL_LINES)[-STDERR_TAIL_LINES:]
+                for line in debug_lines:
+                    print(color(f"  [debug] {line.decode(errors='replace')}", Colors.YELLOW))
             
             # Parse the result (now using camelCase)
-            result = json.loads(stdout.decode())
+            result = json_loads(stdout)
             
             # Display results with new camelCase format
             success = result.get('success', False)
@@ -288,7 +507,8 @@ class SpeechRecognitionTester:
             return None
         except json.JSONDecodeError as e:
             print(color(f"✗ Failed to parse JSON output: {e}", Colors.RED))
-            print(f"  Raw output: {stdout.decode() if stdout else 'None'}")
+            # Output that failed to parse may not be valid UTF-8 either
+            print(f"  Raw output: {stdout.decode(errors='replace') if stdout else 'None'}")
             self.test_results.append({
                 'test_name': test_name,
                 'success': False,
@@ -322,32 +542,22 @@ class SpeechRecognitionTester:
         errors = []
         
         # Required top-level fields
-        required_fields = ['success', 'transcription']
-        for field in required_fields:
-            if field not in result:
-                errors.append(f"Missing required field: {field}")
+        for field in sorted(REQUIRED_FIELDS - result.keys()):
+            errors.append(f"Missing required field: {field}")
         
         # Check for old PascalCase fields (should not exist)
-        old_fields = ['Success', 'Transcription', 'Error_code', 'Error_message']
-        for field in old_fields:
-            if field in result:
-                errors.append(f"Found deprecated PascalCase field: {field}")
+        for field in sorted(DEPRECATED_FIELDS & result.keys()):
+            errors.append(f"Found deprecated PascalCase field: {field}")
         
         # Validate audio object
         if 'audio' in result:
-            audio = result['audio']
-            expected_audio_fields = ['duration', 'sampleRate', 'format']
-            for field in expected_audio_fields:
-                if field not in audio:
-                    errors.append(f"Missing audio.{field}")
+            for field in sorted(AUDIO_FIELDS - result['audio'].keys()):
+                errors.append(f"Missing audio.{field}")
         
         # Validate error object (if present)
         if not result.get('success') and 'error' in result:
-            error = result['error']
-            if 'code' not in error:
-                errors.append("Error object missing 'code' field")
-            if 'message' not in error:
-                errors.append("Error object missing 'message' field")
+            for field in sorted(ERROR_FIELDS - result['error'].keys()):
+                errors.append(f"Error object missing '{field}' field")
         
         # Validate AAC object (if present)
         if 'aac' in result:
@@ -371,19 +581,42 @@ class SpeechRecognitionTester:
         print(f"Script: {self.script_path}")
         print(f"Python: {sys.executable}")
         
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
+        # Generate every input up front and start all recognitions at once;
+        # the results are still reported one test at a time, in order
+        silent_audio = self.create_test_wav(duration=1.0, silent=True)
+        short_audio = self.create_test_wav(duration=0.05, frequency=440)
+        low_rate_audio = self.create_test_wav(duration=1.0, sample_rate=8000)
+        tone_audio = self.create_test_wav(duration=2.0, frequency=440, sample_rate=16000)
+        speech_audio = self.create_speech_like_wav(duration=1.5, sample_rate=16000)
+        noisy_audio = self.create_test_wav(duration=1.5, frequency=440, add_noise=True)
+        timing_audio = self.create_test_wav(duration=1.0, sample_rate=16000)
+        # Truncated mid-sample: the data chunk ends on half a frame
+        odd_audio = pcm_to_wav(tone_audio[WAV_HEADER.size:] + b'\x00', 16000)
+        requests = [
+            (silent_audio, False),
+            (short_audio, False),
+            (low_rate_audio, False),
+            (tone_audio, False),
+            (speech_audio, False),
+            (tone_audio, True),
+            (noisy_audio, False),
+            (timing_audio, False),
+            (odd_audio, False),
+        ]
+        if self.use_worker:
+            self.start_worker()  # Once, before the threads need it
+        with ThreadPoolExecutor(max_workers=max(1, self.jobs)) as pool:
+            responses = [pool.submit(self.run_recognition, audio, command_mode) for audio, command_mode in requests]
             
             # ─────────────────────────────────────────────────────────────
             # Test 1: Silent audio (should fail with audio quality error)
             # ─────────────────────────────────────────────────────────────
             print("\n" + color("[TEST 1] Silent Audio Detection", Colors.BOLD))
-            silent_file = tmpdir / "silent.wav"
-            self.create_test_wav(silent_file, duration=1.0, silent=True)
             result = self.test_with_audio_file(
-                silent_file, 
+                silent_audio, 
                 "Silent Audio (Should Fail)", 
-                expected_success=False
+                expected_success=False,
+                response=responses[0]
             )
             if result:
                 self.test_response_format(result, "Silent Audio")
@@ -392,12 +625,11 @@ class SpeechRecognitionTester:
             # Test 2: Very short audio (should fail or warn)
             # ─────────────────────────────────────────────────────────────
             print("\n" + color("[TEST 2] Very Short Audio", Colors.BOLD))
-            short_file = tmpdir / "short.wav"
-            self.create_test_wav(short_file, duration=0.05, frequency=440)
             result = self.test_with_audio_file(
-                short_file, 
+                short_audio, 
                 "Very Short Audio (0.05s)",
-                expected_success=False
+                expected_success=False,
+                response=responses[1]
             )
             if result:
                 self.test_response_format(result, "Short Audio")
@@ -406,11 +638,10 @@ class SpeechRecognitionTester:
             # Test 3: Low sample rate audio (should process with warning)
             # ─────────────────────────────────────────────────────────────
             print("\n" + color("[TEST 3] Low Sample Rate", Colors.BOLD))
-            low_rate_file = tmpdir / "low_rate.wav"
-            self.create_test_wav(low_rate_file, duration=1.0, sample_rate=8000)
             result = self.test_with_audio_file(
-                low_rate_file, 
-                "Low Sample Rate (8kHz)"
+                low_rate_audio, 
+                "Low Sample Rate (8kHz)",
+                response=responses[2]
             )
             if result:
                 self.test_response_format(result, "Low Sample Rate")
@@ -424,11 +655,10 @@ class SpeechRecognitionTester:
             # Test 4: Normal tone (tests processing pipeline)
             # ─────────────────────────────────────────────────────────────
             print("\n" + color("[TEST 4] Normal Tone Processing", Colors.BOLD))
-            tone_file = tmpdir / "tone.wav"
-            self.create_test_wav(tone_file, duration=2.0, frequency=440, sample_rate=16000)
             result = self.test_with_audio_file(
-                tone_file, 
-                "440Hz Tone (2s)"
+                tone_audio, 
+                "440Hz Tone (2s)",
+                response=responses[3]
             )
             if result:
                 self.test_response_format(result, "Normal Tone")
@@ -437,11 +667,10 @@ class SpeechRecognitionTester:
             # Test 5: Speech-like audio (multiple frequencies)
             # ─────────────────────────────────────────────────────────────
             print("\n" + color("[TEST 5] Speech-like Audio", Colors.BOLD))
-            speech_file = tmpdir / "speech_like.wav"
-            self.create_speech_like_wav(speech_file, duration=1.5, sample_rate=16000)
             result = self.test_with_audio_file(
-                speech_file, 
-                "Speech-like Multi-frequency Audio"
+                speech_audio, 
+                "Speech-like Multi-frequency Audio",
+                response=responses[4]
             )
             if result:
                 self.test_response_format(result, "Speech-like")
@@ -451,9 +680,10 @@ class SpeechRecognitionTester:
             # ─────────────────────────────────────────────────────────────
             print("\n" + color("[TEST 6] Command Mode", Colors.BOLD))
             result = self.test_with_audio_file(
-                tone_file,
+                tone_audio,
                 "Command Mode Recognition",
-                command_mode=True
+                command_mode=True,
+                response=responses[5]
             )
             if result:
                 self.test_response_format(result, "Command Mode")
@@ -468,11 +698,10 @@ class SpeechRecognitionTester:
             # Test 7: Noisy audio
             # ─────────────────────────────────────────────────────────────
             print("\n" + color("[TEST 7] Noisy Audio", Colors.BOLD))
-            noisy_file = tmpdir / "noisy.wav"
-            self.create_test_wav(noisy_file, duration=1.5, frequency=440, add_noise=True)
             result = self.test_with_audio_file(
-                noisy_file,
-                "Audio with Background Noise"
+                noisy_audio,
+                "Audio with Background Noise",
+                response=responses[6]
             )
             if result:
                 self.test_response_format(result, "Noisy Audio")
@@ -481,11 +710,10 @@ class SpeechRecognitionTester:
             # Test 8: Processing time measurement
             # ─────────────────────────────────────────────────────────────
             print("\n" + color("[TEST 8] Processing Time", Colors.BOLD))
-            timing_file = tmpdir / "timing.wav"
-            self.create_test_wav(timing_file, duration=1.0, sample_rate=16000)
             result = self.test_with_audio_file(
-                timing_file,
-                "Processing Time Measurement"
+                timing_audio,
+                "Processing Time Measurement",
+                response=responses[7]
             )
             if result:
                 proc_time = result.get('processingTimeMs', 0)
@@ -497,6 +725,24 @@ class SpeechRecognitionTester:
                         print(color("    ⚠ Processing time over 2s (may be slow for AAC)", Colors.YELLOW))
                 else:
                     print(color("    ✗ Processing time not reported", Colors.RED))
+            
+            # ─────────────────────────────────────────────────────────────
+            # Test 9: Odd-length data chunk (should still reach recognition)
+            # ─────────────────────────────────────────────────────────────
+            print("\n" + color("[TEST 9] Odd-Length Data Chunk", Colors.BOLD))
+            result = self.test_with_audio_file(
+                odd_audio,
+                "Odd-Length Data Chunk",
+                response=responses[8]
+            )
+            if result:
+                self.test_response_format(result, "Odd-Length Data")
+                error_code = (result.get('error') or {}).get('code')
+                if error_code == 'PROCESSING_ERROR':
+                    print(color("    ✗ Trailing partial sample broke processing", Colors.RED))
+                    self.test_results[-1]['test_passed'] = False
+                else:
+                    print(color("    ✓ Trailing partial sample ignored", Colors.GREEN))
         
         # Print summary
         self.print_summary()
@@ -542,6 +788,26 @@ class SpeechRecognitionTester:
             print(color(f"{total - tests_passed} test(s) failed ✗", Colors.RED + Colors.BOLD))
 
 
+# PortAudio is initialized on first use and kept for the rest of the run;
+# initialization scans audio devices and is slow to repeat per recording
+PYAUDIO_INSTANCE = None
+
+
+def get_pyaudio():
+    """
+    Get the shared PyAudio instance, creating it on first use.
+    
+    Returns:
+        pyaudio.PyAudio instance, terminated automatically at exit
+    """
+    global PYAUDIO_INSTANCE
+    if PYAUDIO_INSTANCE is None:
+        import pyaudio
+        PYAUDIO_INSTANCE = pyaudio.PyAudio()
+        atexit.register(PYAUDIO_INSTANCE.terminate)
+    return PYAUDIO_INSTANCE
+
+
 def record_and_test(tester: SpeechRecognitionTester, duration: int = 3, command_mode: bool = False):
     """
     Record audio from microphone and test.
@@ -557,12 +823,12 @@ def record_and_test(tester: SpeechRecognitionTester, duration: int = 3, command_
         print(color("PyAudio not installed. Install with: pip install pyaudio", Colors.RED))
         return
     
-    CHUNK = 1024
+    CHUNK = 4096  # Frames per read; fewer, larger reads keep up more easily
     FORMAT = pyaudio.paInt16
     CHANNELS = 1
     RATE = 16000
     
-    p = pyaudio.PyAudio()
+    p = get_pyaudio()
     
     print(f"\n{color('Recording...', Colors.CYAN)} Speak now! ({duration} seconds)")
     
@@ -574,13 +840,20 @@ def record_and_test(tester: SpeechRecognitionTester, duration: int = 3, command_
         frames_per_buffer=CHUNK
     )
     
-    frames = []
+    # Fill one preallocated buffer instead of joining a list of chunks
+    sample_width = p.get_sample_size(FORMAT)
+    total_frames = int(RATE * duration)
+    frames = bytearray(total_frames * CHANNELS * sample_width)
     
-    for i in range(0, int(RATE / CHUNK * duration)):
-        data = stream.read(CHUNK)
-        frames.append(data)
+    recorded = 0
+    while recorded < total_frames:
+        count = min(CHUNK, total_frames - recorded)
+        data = stream.read(count, exception_on_overflow=False)
+        start = recorded * CHANNELS * sample_width
+        frames[start:start + len(data)] = data
+        recorded += count
         # Progress indicator
-        progress = int((i / (RATE / CHUNK * duration)) * 20)
+        progress = int((recorded / total_frames) * 20)
         sys.stdout.write(f"\r  [{'█' * progress}{'░' * (20-progress)}]")
         sys.stdout.flush()
     
@@ -588,33 +861,15 @@ def record_and_test(tester: SpeechRecognitionTester, duration: int = 3, command_
     
     stream.stop_stream()
     stream.close()
-    p.terminate()
-    
-    # Save recording
-    tmp_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-    tmp_filename = tmp_file.name
-    tmp_file.close()
     
-    wf = wave.open(tmp_filename, 'wb')
-    wf.setnchannels(CHANNELS)
-    wf.setsampwidth(p.get_sample_size(FORMAT))
-    wf.setframerate(RATE)
-    wf.writeframes(b''.join(frames))
-    wf.close()
-    
-    try:
-        result = tester.test_with_audio_file(
-            tmp_filename, 
-            "Microphone Recording",
-            command_mode=command_mode
-        )
-        if result:
-            tester.test_response_format(result, "Microphone Recording")
-    finally:
-        try:
-            os.unlink(tmp_filename)
-        except PermissionError:
-            print(f"Note: Could not delete temp file {tmp_filename}")
+    # Wrap the recording as a WAV in memory; no temp file needed
+    result = tester.test_with_audio_file(
+        pcm_to_wav(bytes(frames), RATE, sample_width), 
+        "Microphone Recording",
+        command_mode=command_mode
+    )
+    if result:
+        tester.test_response_format(result, "Microphone Recording")
 
 
 def main():
@@ -631,6 +886,8 @@ Examples:
   python test.py --record                  # Record from microphone
   python test.py --record --command-mode   # Record with command mode
   python test.py --validate-format         # Only validate response format
+  python test.py --worker                  # Reuse one speech_server.py for all tests
+  python test.py --jobs 1                  # Run the suite's requests one at a time
         """
     )
     parser.add_argument(
@@ -663,28 +920,44 @@ Examples:
         action='store_true',
         help='Only validate response format (requires --audio)'
     )
+    parser.add_argument(
+        '--worker',
+        action='store_true',
+        help='Send requests to one speech_server.py worker instead of a process per test'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=4,
+        help='Recognition requests to run at once in the test suite (default: 4)'
+    )
     
     args = parser.parse_args()
     
-    tester = SpeechRecognitionTester(args.script)
+    tester = SpeechRecognitionTester(args.script, use_worker=args.worker, jobs=args.jobs)
     
-    if args.audio:
-        result = tester.test_with_audio_file(
-            args.audio, 
-            "User Provided Audio",
-            command_mode=args.command_mode
-        )
-        if result:
-            tester.test_response_format(result, "User Audio")
-        tester.print_summary()
-    elif args.record:
-        record_and_test(
-            tester, 
-            duration=args.record_duration,
-            command_mode=args.command_mode
-        )
-    else:
-        tester.run_all_tests()
+    try:
+        if args.worker:
+            tester.start_worker()
+        if args.audio:
+            result = tester.test_with_audio_file(
+                args.audio, 
+                "User Provided Audio",
+                command_mode=args.command_mode
+            )
+            if result:
+                tester.test_response_format(result, "User Audio")
+            tester.print_summary()
+        elif args.record:
+            record_and_test(
+                tester, 
+                duration=args.record_duration,
+                command_mode=args.command_mode
+            )
+        else:
+            tester.run_all_tests()
+    finally:
+        tester.stop_worker()
 
 
 if __name__ == "__main__":